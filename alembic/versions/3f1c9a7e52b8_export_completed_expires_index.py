@@ -0,0 +1,42 @@
+"""Add partial resume_exports expires_at index for completed exports
+
+Revision ID: 3f1c9a7e52b8
+Revises: 60bde4e011c6
+Create Date: 2026-10-16 14:03:27.551920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7e52b8'
+down_revision: Union[str, Sequence[str], None] = '60bde4e011c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so exports stay writable during the build
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_export_completed_expires',
+            'resume_exports',
+            ['expires_at'],
+            unique=False,
+            postgresql_where=sa.text("status = 'COMPLETED'"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_export_completed_expires',
+            table_name='resume_exports',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,41 @@
+"""Add resume_analyses (resume_id, created_at) index
+
+Revision ID: 60bde4e011c6
+Revises: 875bc11a3abf
+Create Date: 2026-10-16 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '60bde4e011c6'
+down_revision: Union[str, Sequence[str], None] = '875bc11a3abf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so existing analyses stay writable during the build
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_analysis_resume_created',
+            'resume_analyses',
+            ['resume_id', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_analysis_resume_created',
+            table_name='resume_analyses',
+            postgresql_concurrently=True
+        )
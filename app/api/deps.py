@@ -9,7 +9,7 @@ import uuid
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 
 from app.config import settings
 from app.core.security import verify_token, get_token_subject
@@ -21,7 +21,7 @@ from app.exceptions import (
 )
 from app.models.user import User, UserRole, UserStatus
 from app.services.auth_service import AuthService
-from app.services.email_service import EmailService
+from app.services.email_service import EmailService, get_email_service as get_shared_email_service
 from app.core.security import rate_limiter
 
 logger = logging.getLogger(__name__)
@@ -29,6 +29,9 @@ logger = logging.getLogger(__name__)
 # Security scheme
 security = HTTPBearer(auto_error=False)
 
+# User lookup run on every authenticated request, built once
+_USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+
 
 # Database dependency
 async def get_db_session() -> AsyncSession:
@@ -40,7 +43,7 @@ async def get_db_session() -> AsyncSession:
 # Service dependencies
 def get_email_service() -> EmailService:
     """Get email service dependency."""
-    return EmailService()
+    return get_shared_email_service()
 
 
 def get_auth_service(
@@ -78,9 +81,7 @@ async def get_current_user_optional(
             return None
         
         # Get user from database
-        result = await session.execute(
-            select(User).where(User.id == uuid.UUID(user_id))
-        )
+        result = await session.execute(_USER_BY_ID, {"user_id": uuid.UUID(user_id)})
         user = result.scalar_one_or_none()
         
         if not user or not user.is_active:
@@ -124,9 +125,7 @@ async def get_current_user(
             raise InvalidTokenException("access token")
         
         # Get user from database
-        result = await session.execute(
-            select(User).where(User.id == uuid.UUID(user_id))
-        )
+        result = await session.execute(_USER_BY_ID, {"user_id": uuid.UUID(user_id)})
         user = result.scalar_one_or_none()
         
         if not user:
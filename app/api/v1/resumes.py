@@ -8,7 +8,7 @@ import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, desc
 
 from app.api.deps import (
     get_db_session, get_current_verified_user, get_pagination_params,
@@ -19,7 +19,7 @@ from app.exceptions import (
     ValidationException, AIServiceException
 )
 from app.models.user import User
-from app.models.resume import ResumeStatus, ResumeType
+from app.models.resume import Resume, ResumeAnalysis, ResumeStatus, ResumeType
 from app.schemas.resume import (
     ResumeResponse, ResumeListResponse, ResumeCreateRequest, ResumeUpdateRequest,
     ResumeAnalysisResponse, ResumeOptimizationRequest, ResumeUploadResponse,
@@ -567,9 +567,6 @@ async def get_resume_stats(
     Returns comprehensive statistics about user's resumes and activities.
     """
     try:
-        from sqlalchemy import func, desc
-        from app.models.resume import Resume, ResumeAnalysis
-        
         # Get resume counts by status
         resume_counts = await session.execute(
             select(Resume.status, func.count(Resume.id))
@@ -66,6 +66,10 @@ class Settings(BaseSettings):
 
         return f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db}"
 
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg prepared statements; 0 behind PgBouncer transaction pooling
+
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
@@ -107,6 +111,7 @@ class Settings(BaseSettings):
     CELERY_RESULT_SERIALIZER: str = "json"
     CELERY_ACCEPT_CONTENT: List[str] = ["json"]
     CELERY_TIMEZONE: str = "UTC"
+    BULK_ANALYSIS_CONCURRENCY: int = 8  # concurrent AI calls per bulk task
 
     # Monitoring
     SENTRY_DSN: Optional[str] = None
@@ -125,6 +130,8 @@ class Settings(BaseSettings):
     # Resume Processing
     MAX_RESUME_VERSIONS: int = 10
     RESUME_ANALYSIS_CACHE_TTL: int = 3600  # 1 hour
+    RESUME_OPTIMIZATION_CACHE_TTL: int = 86400  # 24 hours
+    PDF_PARSER_MAX_WORKERS: int = 2  # processes per API worker for large PDFs, 0 disables
     
     # Job Description Processing
     JOB_DESCRIPTION_MAX_LENGTH: int = 50000
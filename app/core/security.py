@@ -2,7 +2,10 @@
 Security utilities for authentication, password hashing, and JWT tokens.
 """
 
+import base64
 import hashlib
+import html
+import re
 import secrets
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional, Union
@@ -34,16 +37,19 @@ class SecurityManager:
         self.refresh_token_expire_days = settings.REFRESH_TOKEN_EXPIRE_DAYS
     
     # Password Management
-    def hash_password(self, password: str) -> str:
+    def hash_password(self, password: str, rounds: Optional[int] = None) -> str:
         """
         Hash a password using bcrypt.
         
         Args:
             password: Plain text password
+            rounds: bcrypt cost override; only for throwaway development data
             
         Returns:
             Hashed password string
         """
+        if rounds is not None:
+            return self.pwd_context.handler().using(rounds=rounds).hash(password)
         return self.pwd_context.hash(password)
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
@@ -316,8 +322,6 @@ class SecurityManager:
         Returns:
             True if email format is valid, False otherwise
         """
-        import re
-        
         pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
         return bool(re.match(pattern, email))
     
@@ -331,8 +335,6 @@ class SecurityManager:
         Returns:
             Sanitized filename
         """
-        import re
-        
         # Remove path separators and dangerous characters
         filename = re.sub(r'[<>:"/\\|?*]', '', filename)
         filename = re.sub(r'\.{2,}', '.', filename)  # Remove multiple dots
@@ -409,9 +411,9 @@ security = SecurityManager()
 
 
 # Convenience functions for backward compatibility
-def hash_password(password: str) -> str:
+def hash_password(password: str, rounds: Optional[int] = None) -> str:
     """Hash a password using bcrypt."""
-    return security.hash_password(password)
+    return security.hash_password(password, rounds)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -563,7 +565,6 @@ def sanitize_html(text: str) -> str:
     Returns:
         Sanitized text
     """
-    import html
     return html.escape(text)
 
 
@@ -577,8 +578,6 @@ def sanitize_sql_identifier(identifier: str) -> str:
     Returns:
         Sanitized identifier
     """
-    import re
-    
     # Only allow alphanumeric characters and underscores
     sanitized = re.sub(r'[^a-zA-Z0-9_]', '', identifier)
     
@@ -600,7 +599,6 @@ class DataEncryption:
             self.cipher = Fernet(key)
         else:
             # Generate key from settings
-            import base64
             key_material = hashlib.sha256(settings.SECRET_KEY.encode()).digest()
             key = base64.urlsafe_b64encode(key_material)
             self.cipher = Fernet(key)
@@ -7,7 +7,7 @@ import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Optional
 
-from sqlalchemy import MetaData, event, pool
+from sqlalchemy import MetaData, event, pool, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine, AsyncEngine
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.pool import NullPool
@@ -44,9 +44,10 @@ def create_engine() -> AsyncEngine:
         "echo": settings.DEBUG,
         "echo_pool": settings.DEBUG,
         "pool_pre_ping": True,
-        "pool_recycle": 300,  # 5 minutes
-        "pool_size": 20,
-        "max_overflow": 0,
+        "pool_recycle": 1800,  # 30 minutes
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_use_lifo": True,  # Reuse warm connections, let idle overflow ones time out
         "connect_args": {
             "server_settings": {
                 "jit": "off",  # Disable JIT for better connection startup
@@ -64,6 +65,7 @@ def create_engine() -> AsyncEngine:
         engine_kwargs.pop("max_overflow", None)
         engine_kwargs.pop("pool_pre_ping", None)
         engine_kwargs.pop("pool_recycle", None)
+        engine_kwargs.pop("pool_use_lifo", None)
     
     return create_async_engine(str(settings.DATABASE_URL), **engine_kwargs)
 
@@ -80,9 +82,12 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
 
 
 async def init_db() -> None:
-    """Initialize database connection and session maker."""
+    """Initialize database connection and session maker; a no-op once initialized."""
     global engine, async_session_maker
     
+    if engine is not None:
+        return
+    
     try:
         engine = create_engine()
         async_session_maker = async_sessionmaker(
@@ -106,10 +111,12 @@ async def init_db() -> None:
 
 async def close_db() -> None:
     """Close database connections."""
-    global engine
+    global engine, async_session_maker
     
     if engine:
         await engine.dispose()
+        engine = None
+        async_session_maker = None
         logger.info("Database connections closed")
 
 
@@ -239,8 +246,8 @@ async def check_database_health() -> bool:
         if not engine:
             return False
         
-        async with engine.begin() as conn:
-            await conn.run_sync(lambda sync_conn: sync_conn.execute("SELECT 1"))
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
         
         return True
     except Exception as e:
@@ -235,6 +235,14 @@ class ResumeParsingException(FileProcessingException):
         super().__init__(f"Failed to parse resume: {parsing_error}")
 
 
+class ScannedPDFException(ResumeParsingException):
+    """Exception for image-only PDFs that need OCR before they can be parsed."""
+    
+    def __init__(self):
+        super().__init__("PDF appears to be scanned and has no text layer; OCR is required")
+        self.error_code = "SCANNED_PDF"
+
+
 # Job description-specific exceptions
 class JobDescriptionNotFoundException(NotFoundException):
     """Exception for job description not found."""
@@ -467,6 +475,7 @@ __all__ = [
     "ResumeQuotaExceededException",
     "InvalidResumeFormatException",
     "ResumeParsingException",
+    "ScannedPDFException",
     
     # Job description exceptions
     "JobDescriptionNotFoundException",
@@ -3,6 +3,7 @@ FastAPI application entry point.
 Main application configuration and startup/shutdown event handlers.
 """
 
+import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
@@ -21,6 +22,7 @@ from app.api.v1.router import api_router
 from app.config import settings
 from app.database import init_db, close_db, check_database_health
 from app.core.security import rate_limiter
+from app.utils.file_parser import shutdown_pdf_executor
 from app.exceptions import (
     CustomHTTPException,
     ValidationException,
@@ -54,6 +56,9 @@ ERROR_COUNT = Counter(
     ['endpoint', 'error_type']
 )
 
+# Upper bound on each dependency probe in the detailed health check (seconds)
+HEALTH_CHECK_TIMEOUT = 5
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -94,6 +99,9 @@ async def lifespan(app: FastAPI):
         await close_db()
         logger.info("Database connections closed")
         
+        # Waits for in-flight extractions, so keep it off the event loop
+        await asyncio.to_thread(shutdown_pdf_executor)
+        
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
     
@@ -325,13 +333,20 @@ def add_health_endpoints(app: FastAPI) -> None:
             "services": {}
         }
         
-        # Check database
+        # Check database, bounded so a hung connection can't stall the probe
         try:
-            db_healthy = await check_database_health()
+            start_time = time.perf_counter()
+            db_healthy = await asyncio.wait_for(check_database_health(), timeout=HEALTH_CHECK_TIMEOUT)
             health_status["services"]["database"] = {
                 "status": "healthy" if db_healthy else "unhealthy",
-                "response_time": None
+                "response_time": round(time.perf_counter() - start_time, 4)
+            }
+        except asyncio.TimeoutError:
+            health_status["services"]["database"] = {
+                "status": "unhealthy",
+                "error": f"Health check timed out after {HEALTH_CHECK_TIMEOUT}s"
             }
+            health_status["status"] = "unhealthy"
         except Exception as e:
             health_status["services"]["database"] = {
                 "status": "unhealthy",
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 import uuid
 
-from sqlalchemy import Column, DateTime, Boolean, String, text
+from sqlalchemy import Column, DateTime, Boolean, String, select, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import DeclarativeBase
@@ -218,8 +218,6 @@ class QueryMixin:
     @classmethod
     async def get_by_id(cls, session, record_id: uuid.UUID):
         """Get record by ID."""
-        from sqlalchemy import select
-        
         query = select(cls).where(cls.id == record_id)
         result = await session.execute(query)
         return result.scalar_one_or_none()
@@ -227,8 +225,6 @@ class QueryMixin:
     @classmethod
     async def get_all(cls, session, limit: int = 100, offset: int = 0):
         """Get all records with pagination."""
-        from sqlalchemy import select
-        
         query = select(cls).limit(limit).offset(offset)
         result = await session.execute(query)
         return result.scalars().all()
@@ -8,7 +8,7 @@ from typing import Optional, List, Dict, Any
 
 from sqlalchemy import (
     Column, String, Boolean, DateTime, Integer, Text, Float,
-    ForeignKey, Index, CheckConstraint, UniqueConstraint
+    ForeignKey, Index, CheckConstraint, UniqueConstraint, text
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY, TSVECTOR
 from sqlalchemy.orm import relationship, validates
@@ -472,6 +472,7 @@ class ResumeAnalysis(BaseModel):
         CheckConstraint("keyword_score >= 0 AND keyword_score <= 100", name="check_keyword_score"),
         CheckConstraint("format_score >= 0 AND format_score <= 100", name="check_format_score"),
         Index("idx_analysis_resume_type", "resume_id", "analysis_type"),
+        Index("idx_analysis_resume_created", "resume_id", "created_at"),
         Index("idx_analysis_status_created", "status", "created_at"),
         Index("idx_analysis_job_resume", "job_description_id", "resume_id"),
     )
@@ -623,6 +624,12 @@ class ResumeExport(BaseModel):
         Index("idx_export_user_format", "user_id", "export_format"),
         Index("idx_export_status_created", "status", "created_at"),
         Index("idx_export_expires", "expires_at"),
+        # Only completed exports are ever cleaned up on expiry
+        Index(
+            "idx_export_completed_expires",
+            "expires_at",
+            postgresql_where=text("status = 'COMPLETED'")
+        ),
     )
     
     @validates("export_format")
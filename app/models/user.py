@@ -2,6 +2,7 @@
 User-related database models.
 """
 
+import re
 from datetime import datetime
 from enum import Enum
 from typing import Optional, List
@@ -256,8 +257,6 @@ class User(BaseModel):
     @validates("email")
     def validate_email(self, key, email):
         """Validate email format."""
-        import re
-        
         if not email:
             raise ValueError("Email is required")
         
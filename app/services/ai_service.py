@@ -7,6 +7,7 @@ import asyncio
 import json
 import logging
 import time
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Tuple
 import re
 
@@ -111,6 +112,7 @@ class AIService:
             
             processing_time = time.time() - start_time
             result["processing_time"] = processing_time
+            result["word_count"] = len(result.get("optimized_content", "").split())
             
             logger.info(f"Resume optimization completed in {processing_time:.2f}s")
             return result
@@ -639,7 +641,18 @@ class AIService:
                 status["capabilities"][capability] = True
         
         return status
+    
+    async def aclose(self) -> None:
+        """Close the AI clients' HTTP connection pools."""
+        if self.anthropic_client:
+            await self.anthropic_client.close()
+
+
+@lru_cache()
+def get_ai_service() -> AIService:
+    """Get the shared AI service, so its API clients and connection pools are reused."""
+    return AIService()
 
 
 # Export service
-__all__ = ["AIService"]
\ No newline at end of file
+__all__ = ["AIService", "get_ai_service"]
\ No newline at end of file
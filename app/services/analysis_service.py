@@ -25,7 +25,7 @@ from app.schemas.analysis import (
     AnalysisInsightsResponse, AnalysisTrendsResponse, BatchAnalysisRequest,
     BatchAnalysisResponse, AnalysisReportRequest, AnalysisReportResponse
 )
-from app.services.ai_service import AIService
+from app.services.ai_service import get_ai_service
 from app.workers.celery_app import analyze_resume_task, bulk_resume_analysis
 
 logger = logging.getLogger(__name__)
@@ -35,7 +35,7 @@ class AnalysisService:
     """Service for AI-powered resume analysis and insights."""
     
     def __init__(self):
-        self.ai_service = AIService()
+        self.ai_service = get_ai_service()
     
     async def analyze_resume(
         self,
@@ -721,13 +721,22 @@ class AnalysisService:
             Detailed statistics
         """
         try:
-            # Get basic counts
-            total_analyses = await session.execute(
-                select(func.count(ResumeAnalysis.id))
+            week_ago = datetime.utcnow() - timedelta(days=7)
+            completed = ResumeAnalysis.status == ProcessingStatus.COMPLETED
+            
+            # Get counts, recent activity and average scores in a single aggregate
+            summary = await session.execute(
+                select(
+                    func.count(ResumeAnalysis.id),
+                    func.count(ResumeAnalysis.id).filter(ResumeAnalysis.created_at >= week_ago),
+                    func.avg(ResumeAnalysis.overall_score).filter(completed),
+                    func.avg(ResumeAnalysis.ats_score).filter(completed),
+                    func.avg(ResumeAnalysis.content_score).filter(completed)
+                )
                 .join(Resume, ResumeAnalysis.resume_id == Resume.id)
                 .where(Resume.user_id == user_id)
             )
-            total_analyses = total_analyses.scalar()
+            total_analyses, recent_analyses, avg_overall, avg_ats, avg_content = summary.first()
             
             # Get analyses by type
             analyses_by_type = await session.execute(
@@ -738,37 +747,6 @@ class AnalysisService:
             )
             type_counts = dict(analyses_by_type.fetchall())
             
-            # Get recent activity
-            week_ago = datetime.utcnow() - timedelta(days=7)
-            recent_analyses = await session.execute(
-                select(func.count(ResumeAnalysis.id))
-                .join(Resume, ResumeAnalysis.resume_id == Resume.id)
-                .where(
-                    and_(
-                        Resume.user_id == user_id,
-                        ResumeAnalysis.created_at >= week_ago
-                    )
-                )
-            )
-            recent_analyses = recent_analyses.scalar()
-            
-            # Get average scores
-            avg_scores = await session.execute(
-                select(
-                    func.avg(ResumeAnalysis.overall_score),
-                    func.avg(ResumeAnalysis.ats_score),
-                    func.avg(ResumeAnalysis.content_score)
-                )
-                .join(Resume, ResumeAnalysis.resume_id == Resume.id)
-                .where(
-                    and_(
-                        Resume.user_id == user_id,
-                        ResumeAnalysis.status == ProcessingStatus.COMPLETED
-                    )
-                )
-            )
-            avg_overall, avg_ats, avg_content = avg_scores.first()
-            
             return {
                 "total_analyses": total_analyses,
                 "analyses_by_type": type_counts,
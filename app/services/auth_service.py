@@ -7,7 +7,7 @@ from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple
 import uuid
 
-from sqlalchemy import select, update, and_, or_
+from sqlalchemy import bindparam, exists, select, update, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -28,6 +28,12 @@ from app.services.email_service import EmailService
 
 logger = logging.getLogger(__name__)
 
+# User lookups used on login and registration, built once
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+_EMAIL_EXISTS = select(exists().where(User.email == bindparam("email")))
+_USERNAME_EXISTS = select(exists().where(User.username == bindparam("username")))
+
 
 class AuthService:
     """Authentication service for user management and security operations."""
@@ -59,15 +65,12 @@ class AuthService:
         """
         try:
             # Check if user already exists
-            existing_user = await self._get_user_by_email(session, user_data.email)
-            if existing_user:
+            if await self._email_exists(session, user_data.email):
                 raise UserAlreadyExistsException(user_data.email)
             
             # Check username uniqueness if provided
-            if user_data.username:
-                existing_username = await self._get_user_by_username(session, user_data.username)
-                if existing_username:
-                    raise ValidationException("Username already taken")
+            if user_data.username and await self._username_exists(session, user_data.username):
+                raise ValidationException("Username already taken")
             
             # Validate password strength
             password_validation = security.validate_password_strength(user_data.password)
@@ -692,23 +695,22 @@ class AuthService:
     # Helper Methods
     async def _get_user_by_email(self, session: AsyncSession, email: str) -> Optional[User]:
         """Get user by email."""
-        result = await session.execute(
-            select(User).where(User.email == email.lower())
-        )
+        result = await session.execute(_USER_BY_EMAIL, {"email": email.lower()})
         return result.scalar_one_or_none()
     
-    async def _get_user_by_username(self, session: AsyncSession, username: str) -> Optional[User]:
-        """Get user by username."""
-        result = await session.execute(
-            select(User).where(User.username == username)
-        )
-        return result.scalar_one_or_none()
+    async def _email_exists(self, session: AsyncSession, email: str) -> bool:
+        """Check whether a user with the email exists, without loading the row."""
+        result = await session.execute(_EMAIL_EXISTS, {"email": email.lower()})
+        return result.scalar()
+    
+    async def _username_exists(self, session: AsyncSession, username: str) -> bool:
+        """Check whether a user with the username exists, without loading the row."""
+        result = await session.execute(_USERNAME_EXISTS, {"username": username})
+        return result.scalar()
     
     async def _get_user_by_id(self, session: AsyncSession, user_id: uuid.UUID) -> Optional[User]:
         """Get user by ID."""
-        result = await session.execute(
-            select(User).where(User.id == user_id)
-        )
+        result = await session.execute(_USER_BY_ID, {"user_id": user_id})
         return result.scalar_one_or_none()
     
     async def _create_verification_token(
@@ -8,6 +8,7 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 import asyncio
 from jinja2 import Environment, FileSystemLoader, Template
@@ -376,46 +377,44 @@ The {settings.APP_NAME} Team
         subject: str,
         html_content: str,
         text_content: Optional[str] = None,
-        batch_size: int = 50
+        max_concurrency: int = 5,
+        min_send_interval: float = 0.2
     ) -> Dict[str, int]:
         """
-        Send email to multiple recipients in batches.
+        Send email to multiple recipients with bounded concurrency and pacing.
         
         Args:
             recipients: List of email addresses
             subject: Email subject
             html_content: HTML content
             text_content: Plain text content
-            batch_size: Number of emails per batch
+            max_concurrency: Maximum number of SMTP sessions open at once
+            min_send_interval: Minimum seconds between the start of two sends
             
         Returns:
             Dictionary with success and failure counts
         """
-        results = {"success": 0, "failed": 0}
+        # A sliding window instead of fixed batches: a slow SMTP exchange only
+        # holds its own slot rather than stalling the whole batch
+        semaphore = asyncio.Semaphore(max_concurrency)
         
-        # Split recipients into batches
-        for i in range(0, len(recipients), batch_size):
-            batch = recipients[i:i + batch_size]
-            
-            # Send emails in batch
-            tasks = [
-                self.send_email(email, subject, html_content, text_content)
-                for email in batch
-            ]
-            
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    results["failed"] += 1
-                elif result:
-                    results["success"] += 1
-                else:
-                    results["failed"] += 1
-            
-            # Small delay between batches to avoid overwhelming SMTP server
-            if i + batch_size < len(recipients):
-                await asyncio.sleep(1)
+        # Sends start one at a time, min_send_interval apart, so a large list
+        # stays under the SMTP provider's rate limits however fast it answers
+        pacing_lock = asyncio.Lock()
+        
+        async def send_one(email: str) -> bool:
+            async with semaphore:
+                async with pacing_lock:
+                    await asyncio.sleep(min_send_interval)
+                return await self.send_email(email, subject, html_content, text_content)
+        
+        send_results = await asyncio.gather(
+            *(send_one(email) for email in recipients),
+            return_exceptions=True
+        )
+        
+        success = sum(1 for result in send_results if result and not isinstance(result, Exception))
+        results = {"success": success, "failed": len(recipients) - success}
         
         logger.info(f"Bulk email sent: {results['success']} success, {results['failed']} failed")
         return results
@@ -627,5 +626,11 @@ The {settings.APP_NAME} Team
         """
 
 
+@lru_cache()
+def get_email_service() -> EmailService:
+    """Get the shared email service, so its template environment is built once."""
+    return EmailService()
+
+
 # Export service
-__all__ = ["EmailService"]
\ No newline at end of file
+__all__ = ["EmailService", "get_email_service"]
\ No newline at end of file
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import uuid
 
+from celery import group
 from fastapi import HTTPException
 from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy import select, update, and_, desc, func
@@ -25,6 +26,7 @@ from app.models.resume import Resume, ResumeExport, ProcessingStatus
 from app.models.template import ResumeTemplate
 from app.models.user import User
 from app.schemas.resume import ResumeExportRequest, ResumeExportResponse
+from app.workers.celery_app import generate_resume_export
 
 logger = logging.getLogger(__name__)
 
@@ -108,14 +110,12 @@ class ExportService:
             
             session.add(export_record)
             await session.flush()
-
-            from app.workers.celery_app import generate_resume_export
-            
-            # Queue export generation
-            generate_resume_export.delay(str(export_record.id))
             
             await session.commit()
             
+            # Queue export generation once the record is visible to workers
+            generate_resume_export.delay(str(export_record.id))
+            
             logger.info(f"Export created: {export_record.id} for resume {resume_id}")
             return export_record
             
@@ -449,15 +449,14 @@ class ExportService:
                 export_records.append(export_record)
             
             await session.flush()
-
-            from app.workers.celery_app import generate_resume_export
-            
-            # Queue export generation for each
-            for export_record in export_records:
-                generate_resume_export.delay(str(export_record.id))
             
             await session.commit()
             
+            # Queue export generation for each as one group, sharing a single producer
+            group(
+                generate_resume_export.s(str(export_record.id)) for export_record in export_records
+            ).apply_async()
+            
             logger.info(f"Bulk export created: {len(export_records)} exports for user {user_id}")
             return export_records
             
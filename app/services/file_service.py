@@ -20,7 +20,7 @@ from app.config import settings
 from app.core.security import security
 from app.exceptions import (
     FileProcessingException, UnsupportedFileTypeException,
-    FileTooLargeException, MaliciousFileException
+    FileTooLargeException, MaliciousFileException, ScannedPDFException
 )
 from app.utils.file_parser import ResumeParser
 
@@ -100,6 +100,8 @@ class FileService:
             logger.info(f"Resume uploaded and processed: {safe_filename} for user {user_id}")
             return result
             
+        except ScannedPDFException:
+            raise
         except Exception as e:
             logger.error(f"Resume upload failed for user {user_id}: {e}")
             raise FileProcessingException(f"File upload failed: {str(e)}")
@@ -168,6 +170,8 @@ class FileService:
             logger.info(f"File reprocessed: {file_path}")
             return parsing_result
             
+        except ScannedPDFException:
+            raise
         except Exception as e:
             logger.error(f"File reprocessing failed: {file_path}, error: {e}")
             raise FileProcessingException(f"File reprocessing failed: {str(e)}")
@@ -258,6 +262,8 @@ class FileService:
             else:
                 raise FileProcessingException(f"Unsupported file type for parsing: {mime_type}")
                 
+        except ScannedPDFException:
+            raise
         except Exception as e:
             logger.error(f"File parsing failed: {file_path}, error: {e}")
             return {
@@ -30,7 +30,7 @@ from app.schemas.job_description import (
     JobAnalysisResponse, JobMatchResponse, JobSearchRequest,
     JobStatsResponse, JobImportRequest, JobUrlExtractionResponse
 )
-from app.services.ai_service import AIService
+from app.services.ai_service import get_ai_service
 from app.workers.celery_app import analyze_job_description_task, extract_job_from_url_task
 
 logger = logging.getLogger(__name__)
@@ -40,7 +40,7 @@ class JobDescriptionService:
     """Service for job description management and analysis."""
     
     def __init__(self):
-        self.ai_service = AIService()
+        self.ai_service = get_ai_service()
     
     async def create_job_description(
         self,
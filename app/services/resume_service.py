@@ -16,7 +16,7 @@ from sqlalchemy.orm import selectinload, joinedload
 from app.config import settings
 from app.exceptions import (
     ResumeNotFoundException, ResumeQuotaExceededException, 
-    ValidationException, AIServiceException, FileProcessingException
+    ValidationException, AIServiceException, FileProcessingException, ScannedPDFException
 )
 from app.models.resume import (
     Resume, ResumeSection, ResumeAnalysis, ResumeExport,
@@ -25,7 +25,7 @@ from app.models.resume import (
 from app.models.user import User
 from app.models.job_description import JobDescription, JobMatch
 from app.services.file_service import FileService
-from app.services.ai_service import AIService
+from app.services.ai_service import get_ai_service
 from app.workers.celery_app import analyze_resume_task, optimize_resume_task
 
 logger = logging.getLogger(__name__)
@@ -36,7 +36,7 @@ class ResumeService:
     
     def __init__(self):
         self.file_service = FileService()
-        self.ai_service = AIService()
+        self.ai_service = get_ai_service()
     
     async def create_resume(
         self,
@@ -158,9 +158,10 @@ class ResumeService:
                 
                 await session.commit()
                 
-                # Trigger background analysis
+                # Trigger background analysis; scores land on the resume,
+                # so skip the result backend write
                 if resume.raw_text:
-                    analyze_resume_task.delay(str(resume.id))
+                    analyze_resume_task.apply_async((str(resume.id),), ignore_result=True)
                 
                 logger.info(f"Resume uploaded and parsed: {resume.id} for user {user_id}")
                 return resume
@@ -169,6 +170,8 @@ class ResumeService:
                 # Update resume status to error
                 resume.status = ResumeStatus.ERROR
                 await session.commit()
+                if isinstance(e, ScannedPDFException):
+                    raise
                 raise FileProcessingException(f"File processing failed: {str(e)}")
                 
         except Exception as e:
@@ -544,7 +547,7 @@ class ResumeService:
                 await session.commit()
                 
                 # Trigger background analysis of optimized resume
-                analyze_resume_task.delay(str(optimized_resume.id))
+                analyze_resume_task.apply_async((str(optimized_resume.id),), ignore_result=True)
                 
                 logger.info(f"Resume optimized: {resume_id} -> {optimized_resume.id}")
                 return optimized_resume
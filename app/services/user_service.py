@@ -19,7 +19,7 @@ from app.exceptions import (
 from app.models.user import (
     User, UserSession, UserVerification, UserRole, UserStatus, SubscriptionType
 )
-from app.models.resume import Resume
+from app.models.resume import Resume, ResumeAnalysis
 from app.models.job_description import JobDescription
 from app.schemas.user import (
     UserUpdate, UserResponse, UserStatsResponse, UserPreferencesUpdate,
@@ -183,7 +183,6 @@ class UserService:
             job_applications_count = 0
             
             # Get analyses count
-            from app.models.resume import ResumeAnalysis
             analyses_count = await session.execute(
                 select(func.count(ResumeAnalysis.id))
                 .join(Resume, ResumeAnalysis.resume_id == Resume.id)
@@ -0,0 +1,99 @@
+"""
+Redis cache for AI results, keyed by a hash of the content sent to the model.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import redis.asyncio as redis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_redis_client: Optional[redis.Redis] = None
+
+
+def _get_redis() -> redis.Redis:
+    """Get the shared Redis client, created on first use."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(settings.REDIS_URL, db=settings.REDIS_DB)
+    return _redis_client
+
+
+def make_cache_key(namespace: str, *parts: str) -> str:
+    """Build a cache key from the SHA-256 of the given content parts."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\0")  # Keep ("ab", "c") and ("a", "bc") apart
+    return f"{namespace}:{digest.hexdigest()}"
+
+
+async def get_or_compute(
+    key: str,
+    compute: Callable[[], Awaitable[Dict[str, Any]]],
+    ttl: int,
+    refresh: bool = False,
+    should_cache: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    per_call_fields: Tuple[str, ...] = ()
+) -> Dict[str, Any]:
+    """
+    Return the cached result for a key, or compute and cache it.
+    
+    Redis errors are logged and never fail the caller; the result is then
+    simply computed without caching.
+    
+    Args:
+        key: Cache key from make_cache_key
+        compute: Coroutine factory producing the JSON-serializable result
+        ttl: Time to live in seconds
+        refresh: Skip the lookup and overwrite the cached result
+        should_cache: Predicate deciding whether a computed result is stored;
+            results it rejects are returned but not cached
+        per_call_fields: Keys describing this particular call (timings etc.),
+            left out of the cached copy so hits don't report stale values
+    
+    Returns:
+        Cached or freshly computed result
+    """
+    client = _get_redis()
+    
+    if not refresh:
+        try:
+            cached = await client.get(key)
+            if cached is not None:
+                logger.info(f"AI cache hit: {key}")
+                return json.loads(cached)
+        except Exception as e:
+            logger.warning(f"AI cache read failed: {key}, error: {e}")
+    
+    result = await compute()
+    
+    if should_cache is not None and not should_cache(result):
+        logger.info(f"AI cache skipped for rejected result: {key}")
+        return result
+    
+    cached_result = {k: v for k, v in result.items() if k not in per_call_fields}
+    
+    try:
+        await client.setex(key, ttl, json.dumps(cached_result))
+    except Exception as e:
+        logger.warning(f"AI cache write failed: {key}, error: {e}")
+    
+    return result
+
+
+async def close_cache() -> None:
+    """Close the shared Redis client."""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
+
+
+# Export cache helpers
+__all__ = ["make_cache_key", "get_or_compute", "close_cache"]
@@ -2,28 +2,284 @@
 File parser utilities for extracting text and structured data from resume files.
 """
 
+import hashlib
 import logging
+import multiprocessing
+import pickle
 import re
+import zipfile
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 import asyncio
 
-import aiofiles
+from lxml import etree
 from pdfplumber import PDF
-from docx import Document
-import fitz  # PyMuPDF as fallback
+
+from app.config import settings
+from app.exceptions import ScannedPDFException
 
 logger = logging.getLogger(__name__)
 
+# Four-digit years between 1900 and 2099
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+# Explicit statements of experience, e.g. "5+ years of experience"
+_EXPERIENCE_YEARS_RES = [
+    re.compile(r'(\d+)[\+\s]*years?\s+of\s+experience', re.IGNORECASE),
+    re.compile(r'(\d+)[\+\s]*years?\s+experience', re.IGNORECASE),
+    re.compile(r'over\s+(\d+)\s+years?', re.IGNORECASE),
+    re.compile(r'more\s+than\s+(\d+)\s+years?', re.IGNORECASE)
+]
+
+# Common technical skills
+TECH_SKILLS = (
+    # Programming languages
+    'Python', 'Java', 'JavaScript', 'C++', 'C#', 'PHP', 'Ruby', 'Go', 'Rust', 'Swift', 'Kotlin',
+    # Frameworks
+    'React', 'Angular', 'Vue', 'Django', 'Flask', 'Spring', 'Express', 'Laravel',
+    # Databases
+    'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'SQLite', 'Oracle',
+    # Cloud platforms
+    'AWS', 'Azure', 'GCP', 'Google Cloud', 'Heroku', 'DigitalOcean',
+    # Tools
+    'Git', 'Docker', 'Kubernetes', 'Jenkins', 'Terraform', 'Ansible'
+)
+
+
+def _trie_alternation(words: Tuple[str, ...]) -> str:
+    """
+    Build a lowercase regex alternation of words factored into a character trie.
+    
+    Shared prefixes ("go"/"google cloud"/"git") are matched once instead of being
+    retried per alternative; longer words win because optional suffixes are greedy.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word.lower():
+            node = node.setdefault(char, {})
+        node[''] = {}  # end of word
+    
+    def to_pattern(node: Dict[str, Any]) -> str:
+        alternatives = [re.escape(char) + to_pattern(child) for char, child in node.items() if char]
+        if not alternatives:
+            return ''
+        body = alternatives[0] if len(alternatives) == 1 else '(?:' + '|'.join(alternatives) + ')'
+        return f'(?:{body})?' if '' in node else body
+    
+    return to_pattern(trie)
+
+
+# Single pass over the text for all skills; lookarounds instead of \b so "C++" and "C#" match.
+# Built once at import, so forked workers share it.
+_SKILLS_RE = re.compile(r'(?<!\w)(?:' + _trie_alternation(TECH_SKILLS) + r')(?!\w)', re.IGNORECASE)
+
+# Skill list delimiters, all mapped to a comma so lines split with str.split
+_SKILL_DELIMITERS = str.maketrans({delimiter: ',' for delimiter in ';|•-\n'})
+_PHONE_STRIP_RE = re.compile(r'[^\d+]')
+_KEYWORD_RE = re.compile(r'\b[A-Za-z]{3,}\b')
+
+# Common stop words excluded from keyword extraction
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'been', 'be', 'have',
+    'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should'
+})
+
+# Common job title patterns
+_JOB_TITLE_INDICATORS = (
+    'manager', 'director', 'engineer', 'developer', 'analyst',
+    'specialist', 'coordinator', 'assistant', 'lead', 'senior',
+    'junior', 'intern', 'consultant', 'architect', 'designer'
+)
+
+_DEGREE_INDICATORS = (
+    'bachelor', 'master', 'phd', 'doctorate', 'associate',
+    'certificate', 'diploma', 'b.s.', 'b.a.', 'm.s.', 'm.a.',
+    'mba', 'university', 'college', 'institute'
+)
+
+
+def _unique_casefold(values: List[str]) -> List[str]:
+    """Deduplicate strings case-insensitively, keeping the first spelling and original order."""
+    unique = {}
+    for value in values:
+        unique.setdefault(value.casefold(), value)
+    return list(unique.values())
+
+
+# Structured data of recently parsed texts, keyed by content digest, for
+# re-uploads and reprocessing of identical resumes
+_STRUCTURED_DATA_CACHE_SIZE = 256
+_structured_data_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+
+# Below this many pages the worker pool costs more than it saves
+_PARALLEL_PDF_MIN_PAGES = 4
+
+_pdf_executor: Optional[ProcessPoolExecutor] = None
+
+# Less text than this alongside image-only pages means the PDF is a scan
+_SCANNED_PDF_MAX_TEXT_LENGTH = 40
+
+
+def _get_pdf_executor() -> Optional[ProcessPoolExecutor]:
+    """Get the shared PDF extraction pool, or None where it is disabled or child processes are not allowed."""
+    global _pdf_executor
+    
+    # Daemonic processes (e.g. Celery prefork workers) cannot start children
+    if settings.PDF_PARSER_MAX_WORKERS < 1 or multiprocessing.current_process().daemon:
+        return None
+    
+    if _pdf_executor is None:
+        # Spawned rather than forked: the parent runs an event loop and threads
+        _pdf_executor = ProcessPoolExecutor(
+            max_workers=settings.PDF_PARSER_MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pdf_executor
+
+
+def shutdown_pdf_executor() -> None:
+    """Shut down the shared PDF extraction pool, if it was started."""
+    global _pdf_executor
+    
+    if _pdf_executor is not None:
+        _pdf_executor.shutdown(cancel_futures=True)
+        _pdf_executor = None
+
+
+def _extract_page_text(page) -> Tuple[str, bool]:
+    """Extract a pdfplumber page's text and whether it is an image-only (scanned) page."""
+    page_text = page.extract_text() or ""
+    return page_text, not page_text.strip() and bool(page.images)
+
+
+def _extract_pdf_pages(file_path: str, page_numbers: List[int]) -> List[Tuple[str, bool]]:
+    """Extract text from the given PDF pages (runs in a worker process)."""
+    with PDF.open(file_path) as pdf:
+        return [_extract_page_text(pdf.pages[page_number]) for page_number in page_numbers]
+
+
+def _extract_pdf_pages_serial(
+    file_path: Path,
+    parallel_min_pages: Optional[int]
+) -> Tuple[int, Optional[List[Tuple[str, bool]]]]:
+    """
+    Get the PDF page count and, unless the PDF is left to the worker pool, its pages' text.
+    
+    Pages are None when parallel_min_pages is set and the PDF has at least that many.
+    """
+    with PDF.open(file_path) as pdf:
+        page_count = len(pdf.pages)
+        if parallel_min_pages is not None and page_count >= parallel_min_pages:
+            return page_count, None
+        return page_count, [_extract_page_text(page) for page in pdf.pages]
+
+
+def _extract_pdf_text_pymupdf(file_path: Path) -> Tuple[List[str], int, bool]:
+    """Extract page text, page count and whether any page is image-only from a single PyMuPDF open."""
+    # Imported lazily, only needed when pdfplumber fails
+    import fitz
+    
+    with fitz.open(file_path) as doc:
+        text_parts = []
+        has_scanned_pages = False
+        for page in doc:
+            page_text = page.get_text()
+            text_parts.append(page_text)
+            has_scanned_pages = has_scanned_pages or (not page_text.strip() and bool(page.get_images()))
+        
+        return text_parts, doc.page_count, has_scanned_pages
+
+
+_WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_WORD_TEXT = _WORD_NAMESPACE + 't'
+_WORD_PARAGRAPH = _WORD_NAMESPACE + 'p'
+_WORD_RUN = _WORD_NAMESPACE + 'r'
+_WORD_TAB = _WORD_NAMESPACE + 'tab'
+_WORD_BREAKS = (_WORD_NAMESPACE + 'br', _WORD_NAMESPACE + 'cr')
+
+# Alternate content carries a fallback copy of e.g. text boxes for older readers
+_MARKUP_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+# Run content rendered the way python-docx renders it
+_WORD_RUN_CHARACTERS = {_WORD_TAB: '\t', **{tag: '\n' for tag in _WORD_BREAKS}}
+
+
+def _extract_docx_text(file_path: Path) -> str:
+    """Extract DOCX text by streaming the document XML, falling back to python-docx."""
+    try:
+        text_parts = []
+        fallback_depth = 0
+        with zipfile.ZipFile(file_path) as archive, archive.open('word/document.xml') as document_xml:
+            # Text runs and paragraph ends arrive in document order, tables included
+            for event, element in etree.iterparse(
+                document_xml,
+                events=('start', 'end'),
+                tag=(_WORD_TEXT, _WORD_PARAGRAPH, _WORD_TAB, *_WORD_BREAKS, _MARKUP_FALLBACK)
+            ):
+                if element.tag == _MARKUP_FALLBACK:
+                    fallback_depth += 1 if event == 'start' else -1
+                    continue
+                
+                if event == 'start':
+                    continue
+                
+                if not fallback_depth:
+                    if element.tag == _WORD_TEXT:
+                        text_parts.append(element.text or '')
+                    elif element.tag == _WORD_PARAGRAPH:
+                        text_parts.append('\n')
+                    elif element.getparent().tag == _WORD_RUN:
+                        # Tabs also appear as tab stop definitions outside runs
+                        text_parts.append(_WORD_RUN_CHARACTERS[element.tag])
+                
+                if element.tag in (_WORD_TEXT, _WORD_PARAGRAPH):
+                    element.clear()
+        
+        return ''.join(text_parts)
+        
+    except (KeyError, etree.XMLSyntaxError) as e:
+        logger.warning(f"Streaming DOCX extraction failed for {file_path}, using python-docx: {e}")
+        return _extract_docx_text_python_docx(file_path)
+
+
+def _extract_docx_text_python_docx(file_path: Path) -> str:
+    """Extract DOCX text through python-docx's full document model."""
+    # Imported lazily, only needed when streaming extraction fails
+    from docx import Document
+    
+    doc = Document(file_path)
+    
+    # Extract text from paragraphs
+    text_parts = [paragraph.text for paragraph in doc.paragraphs]
+    
+    # Extract text from tables
+    for table in doc.tables:
+        for row in table.rows:
+            text_parts.append(" ".join(cell.text for cell in row.cells))
+    
+    return "\n".join(text_parts)
+
 
 class ResumeParser:
     """Parser for extracting content from resume files."""
     
     def __init__(self):
-        self.phone_pattern = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+        self.phone_pattern = re.compile(r'(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
         self.email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
         self.url_pattern = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
         
+        # Combined pattern so contact details are collected in a single scan; the
+        # component patterns must not add capturing groups of their own
+        self.contact_pattern = re.compile(
+            f'(?P<email>{self.email_pattern.pattern})'
+            f'|(?P<url>{self.url_pattern.pattern})'
+            f'|(?P<phone>{self.phone_pattern.pattern})'
+        )
+        
         # Common section headers
         self.section_headers = {
             'experience': ['experience', 'work experience', 'employment', 'career history', 'professional experience'],
@@ -35,46 +291,73 @@ class ResumeParser:
             'summary': ['summary', 'profile', 'objective', 'professional summary', 'career objective'],
             'contact': ['contact', 'contact information', 'personal details']
         }
+        
+        # One named group per section; the whole line must be a known header
+        # plus optional formatting characters, and match.lastgroup names the section
+        section_alternatives = '|'.join(
+            f'(?P<{section_type}>' + '|'.join(
+                re.escape(header).replace(r'\ ', r'[ \t]+') for header in headers
+            ) + ')'
+            for section_type, headers in self.section_headers.items()
+        )
+        self.section_header_pattern = re.compile(
+            r'^[ \t:\-_=*#]*(?:' + section_alternatives + r')[ \t\r:\-_=*#]*$',
+            re.IGNORECASE | re.MULTILINE
+        )
     
     async def parse_pdf(self, file_path: Path) -> Dict[str, Any]:
         """Parse PDF resume file."""
         try:
-            text_content = ""
             page_count = 0
             
             # Try pdfplumber first (better for text extraction)
             try:
-                with PDF.open(file_path) as pdf:
-                    page_count = len(pdf.pages)
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text_content += page_text + "\n"
+                executor = _get_pdf_executor()
+                page_count, pages = await asyncio.to_thread(
+                    _extract_pdf_pages_serial,
+                    file_path,
+                    _PARALLEL_PDF_MIN_PAGES if executor is not None else None
+                )
+                
+                if pages is None:
+                    pages = await self._extract_pdf_pages_parallel(executor, file_path, page_count)
+                
+                text_parts = [page_text for page_text, _ in pages if page_text]
+                has_scanned_pages = any(is_scanned for _, is_scanned in pages)
             except Exception as e:
                 logger.warning(f"pdfplumber failed for {file_path}, trying PyMuPDF: {e}")
                 
                 # Fallback to PyMuPDF
-                doc = fitz.open(file_path)
-                page_count = len(doc)
-                for page_num in range(page_count):
-                    page = doc.load_page(page_num)
-                    text_content += page.get_text() + "\n"
-                doc.close()
+                text_parts, page_count, has_scanned_pages = await asyncio.to_thread(
+                    _extract_pdf_text_pymupdf, file_path
+                )
             
-            if not text_content.strip():
+            text_content = "\n".join(text_parts)
+            
+            # Strip once and reuse for validation, extraction and the result
+            text_content = text_content.strip()
+            
+            # Image-only pages and (almost) no text: report it as needing OCR
+            if has_scanned_pages and len(text_content) < _SCANNED_PDF_MAX_TEXT_LENGTH:
+                raise ScannedPDFException()
+            
+            if not text_content:
                 raise ValueError("No text content extracted from PDF")
             
             # Extract structured data
-            structured_data = await self._extract_structured_data(text_content)
+            structured_data = self._extract_structured_data(text_content)
             
             return {
-                "raw_text": text_content.strip(),
+                "raw_text": text_content,
                 "structured_data": structured_data,
                 "word_count": len(text_content.split()),
                 "page_count": page_count,
                 "file_type": "pdf"
             }
             
+        except ScannedPDFException:
+            # Callers need to tell scans apart from other parsing failures
+            raise
         except Exception as e:
             logger.error(f"PDF parsing failed for {file_path}: {e}")
             return {
@@ -86,35 +369,48 @@ class ResumeParser:
                 "file_type": "pdf"
             }
     
+    async def _extract_pdf_pages_parallel(
+        self,
+        executor: ProcessPoolExecutor,
+        file_path: Path,
+        page_count: int
+    ) -> List[Tuple[str, bool]]:
+        """Extract PDF page text and scanned-page flags across the worker pool, preserving page order."""
+        loop = asyncio.get_running_loop()
+        
+        # One contiguous chunk of pages per worker so each opens the file once
+        chunk_size = -(-page_count // settings.PDF_PARSER_MAX_WORKERS)
+        chunks = [
+            list(range(start, min(start + chunk_size, page_count)))
+            for start in range(0, page_count, chunk_size)
+        ]
+        
+        results = await asyncio.gather(*(
+            loop.run_in_executor(executor, _extract_pdf_pages, str(file_path), chunk)
+            for chunk in chunks
+        ))
+        
+        return [page for chunk_pages in results for page in chunk_pages]
+    
     async def parse_docx(self, file_path: Path) -> Dict[str, Any]:
         """Parse DOCX resume file."""
         try:
-            doc = Document(file_path)
+            text_content = await asyncio.to_thread(_extract_docx_text, file_path)
             
-            # Extract text from paragraphs
-            text_content = ""
-            for paragraph in doc.paragraphs:
-                text_content += paragraph.text + "\n"
-            
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        text_content += cell.text + " "
-                    text_content += "\n"
-            
-            if not text_content.strip():
+            # Strip once and reuse for validation, extraction and the result
+            text_content = text_content.strip()
+            if not text_content:
                 raise ValueError("No text content extracted from DOCX")
             
             # Extract structured data
-            structured_data = await self._extract_structured_data(text_content)
+            structured_data = self._extract_structured_data(text_content)
             
             # Estimate page count (approximate)
             word_count = len(text_content.split())
             estimated_pages = max(1, (word_count // 300))  # ~300 words per page
             
             return {
-                "raw_text": text_content.strip(),
+                "raw_text": text_content,
                 "structured_data": structured_data,
                 "word_count": word_count,
                 "page_count": estimated_pages,
@@ -164,21 +460,22 @@ class ResumeParser:
     async def parse_text(self, file_path: Path) -> Dict[str, Any]:
         """Parse plain text resume file."""
         try:
-            async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                text_content = await f.read()
+            text_content = await asyncio.to_thread(file_path.read_text, encoding='utf-8')
             
-            if not text_content.strip():
+            # Strip once and reuse for validation, extraction and the result
+            text_content = text_content.strip()
+            if not text_content:
                 raise ValueError("File is empty")
             
             # Extract structured data
-            structured_data = await self._extract_structured_data(text_content)
+            structured_data = self._extract_structured_data(text_content)
             
             # Estimate page count
             word_count = len(text_content.split())
             estimated_pages = max(1, (word_count // 300))
             
             return {
-                "raw_text": text_content.strip(),
+                "raw_text": text_content,
                 "structured_data": structured_data,
                 "word_count": word_count,
                 "page_count": estimated_pages,
@@ -196,7 +493,30 @@ class ResumeParser:
                 "file_type": "txt"
             }
     
-    async def _extract_structured_data(self, text: str) -> Dict[str, Any]:
+    def _extract_structured_data(self, text: str) -> Dict[str, Any]:
+        """Extract structured data from resume text, reusing results for previously parsed text."""
+        text_digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        
+        cached_data = _structured_data_cache.get(text_digest)
+        if cached_data is not None:
+            _structured_data_cache.move_to_end(text_digest)
+            
+            # Every hit unpickles its own copy, so callers cannot mutate the cache
+            return pickle.loads(cached_data)
+        
+        structured_data = self._build_structured_data(text)
+        
+        # Failed extractions are not cached so they are retried next time.
+        # Entries are stored pickled: immutable, and far cheaper to write and
+        # read back than a deep copy of the nested dict
+        if structured_data:
+            _structured_data_cache[text_digest] = pickle.dumps(structured_data, pickle.HIGHEST_PROTOCOL)
+            if len(_structured_data_cache) > _STRUCTURED_DATA_CACHE_SIZE:
+                _structured_data_cache.popitem(last=False)
+        
+        return structured_data
+    
+    def _build_structured_data(self, text: str) -> Dict[str, Any]:
         """Extract structured data from resume text."""
         try:
             structured_data = {}
@@ -231,74 +551,45 @@ class ResumeParser:
             "urls": []
         }
         
-        # Extract email
-        email_matches = self.email_pattern.findall(text)
-        if email_matches:
-            contact_info["email"] = email_matches[0].lower()
+        # findall yields (email, url, phone) tuples with only the matched slot non-empty
+        urls = []
+        for email, url, phone in self.contact_pattern.findall(text):
+            if email:
+                if contact_info["email"] is None:
+                    contact_info["email"] = email.lower()
+            elif url:
+                urls.append(url)
+            elif contact_info["phone"] is None:
+                # Clean up phone number
+                contact_info["phone"] = _PHONE_STRIP_RE.sub('', phone)
         
-        # Extract phone
-        phone_matches = self.phone_pattern.findall(text)
-        if phone_matches:
-            # Clean up phone number
-            phone = re.sub(r'[^\d+]', '', phone_matches[0])
-            contact_info["phone"] = phone
-        
-        # Extract URLs
-        url_matches = self.url_pattern.findall(text)
-        contact_info["urls"] = list(set(url_matches))  # Remove duplicates
+        contact_info["urls"] = list(dict.fromkeys(urls))  # Remove duplicates
         
         return contact_info
     
     def _identify_sections(self, text: str) -> Dict[str, Any]:
         """Identify and extract resume sections."""
         sections = {}
-        lines = text.split('\n')
-        current_section = None
-        section_content = []
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Check if line is a section header
-            detected_section = self._detect_section_header(line)
-            
-            if detected_section:
-                # Save previous section
-                if current_section and section_content:
-                    sections[current_section] = self._process_section_content(
-                        current_section, section_content
-                    )
-                
-                # Start new section
-                current_section = detected_section
-                section_content = []
-            elif current_section:
-                section_content.append(line)
+        # Locate all header lines in one pass instead of splitting the whole text
+        headers = [
+            (match.lastgroup, match.start(), match.end())
+            for match in self.section_header_pattern.finditer(text)
+        ]
         
-        # Save last section
-        if current_section and section_content:
-            sections[current_section] = self._process_section_content(
-                current_section, section_content
-            )
+        for index, (section_type, _, body_start) in enumerate(headers):
+            body_end = headers[index + 1][1] if index + 1 < len(headers) else len(text)
+            section_content = [
+                line.strip() for line in text[body_start:body_end].splitlines() if line.strip()
+            ]
+            
+            if section_content:
+                sections[section_type] = self._process_section_content(
+                    section_type, section_content
+                )
         
         return sections
     
-    def _detect_section_header(self, line: str) -> Optional[str]:
-        """Detect if a line is a section header."""
-        line_lower = line.lower().strip()
-        
-        # Remove common formatting characters
-        clean_line = re.sub(r'[:\-_=*#]+', '', line_lower).strip()
-        
-        for section_type, headers in self.section_headers.items():
-            for header in headers:
-                if header in clean_line:
-                    return section_type
-        
-        return None
-    
     def _process_section_content(self, section_type: str, content: List[str]) -> Any:
         """Process section content based on section type."""
         if section_type == "experience":
@@ -315,27 +606,8 @@ class ResumeParser:
     
     def _parse_experience_section(self, content: List[str]) -> List[Dict[str, str]]:
         """Parse work experience section."""
-        experiences = []
-        current_job = {}
-        
-        for line in content:
-            # Simple parsing - in production, use more sophisticated NLP
-            if self._looks_like_job_title(line):
-                if current_job:
-                    experiences.append(current_job)
-                current_job = {"title": line, "description": []}
-            elif current_job:
-                current_job["description"].append(line)
-        
-        if current_job:
-            experiences.append(current_job)
-        
-        # Convert descriptions to text
-        for exp in experiences:
-            if "description" in exp:
-                exp["description"] = "\n".join(exp["description"])
-        
-        return experiences
+        # Simple parsing - in production, use more sophisticated NLP
+        return self._split_titled_entries(content, self._looks_like_job_title)
     
     def _parse_education_section(self, content: List[str]) -> List[Dict[str, str]]:
         """Parse education section."""
@@ -353,83 +625,44 @@ class ResumeParser:
         
         for line in content:
             # Split by common delimiters
-            line_skills = re.split(r'[,;|•\-\n]', line)
+            line_skills = line.translate(_SKILL_DELIMITERS).split(',')
             for skill in line_skills:
                 skill = skill.strip()
                 if skill and len(skill) > 1:
                     skills.append(skill)
         
-        return list(set(skills))  # Remove duplicates
+        return _unique_casefold(skills)  # Remove duplicates
     
     def _parse_projects_section(self, content: List[str]) -> List[Dict[str, str]]:
         """Parse projects section."""
-        projects = []
-        current_project = {}
-        
-        for line in content:
-            if self._looks_like_project_title(line):
-                if current_project:
-                    projects.append(current_project)
-                current_project = {"title": line, "description": []}
-            elif current_project:
-                current_project["description"].append(line)
-        
-        if current_project:
-            projects.append(current_project)
-        
-        # Convert descriptions to text
-        for proj in projects:
-            if "description" in proj:
-                proj["description"] = "\n".join(proj["description"])
-        
-        return projects
+        return self._split_titled_entries(content, self._looks_like_project_title)
+    
+    def _split_titled_entries(
+        self,
+        content: List[str],
+        is_title: Callable[[str], bool]
+    ) -> List[Dict[str, str]]:
+        """Split section lines into title/description entries starting at each title line."""
+        # Lines before the first title do not belong to any entry
+        starts = [index for index, line in enumerate(content) if is_title(line)]
+        ends = starts[1:] + [len(content)]
+        
+        return [
+            {"title": content[start], "description": "\n".join(content[start + 1:end])}
+            for start, end in zip(starts, ends)
+        ]
     
     def _extract_skills(self, text: str) -> List[str]:
         """Extract skills using keyword matching."""
-        # Common technical skills patterns
-        skill_patterns = [
-            # Programming languages
-            r'\b(Python|Java|JavaScript|C\+\+|C#|PHP|Ruby|Go|Rust|Swift|Kotlin)\b',
-            # Frameworks
-            r'\b(React|Angular|Vue|Django|Flask|Spring|Express|Laravel)\b',
-            # Databases
-            r'\b(MySQL|PostgreSQL|MongoDB|Redis|SQLite|Oracle)\b',
-            # Cloud platforms
-            r'\b(AWS|Azure|GCP|Google Cloud|Heroku|DigitalOcean)\b',
-            # Tools
-            r'\b(Git|Docker|Kubernetes|Jenkins|Terraform|Ansible)\b'
-        ]
-        
-        skills = []
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            skills.extend(matches)
-        
-        return list(set(skills))
+        return _unique_casefold(_SKILLS_RE.findall(text))
     
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract important keywords from resume."""
-        # Remove common stop words and extract meaningful terms
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'been', 'be', 'have',
-            'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should'
-        }
-        
-        # Extract words that are likely keywords
-        words = re.findall(r'\b[A-Za-z]{3,}\b', text)
-        keywords = []
-        
-        for word in words:
-            word_lower = word.lower()
-            if (word_lower not in stop_words and 
-                len(word) >= 3 and 
-                not word_lower.isdigit()):
-                keywords.append(word)
-        
-        # Count frequency and return most common
-        from collections import Counter
-        word_counts = Counter(keywords)
+        # Count every token in C, then drop stop words once per distinct word
+        # rather than once per occurrence
+        word_counts = Counter(_KEYWORD_RE.findall(text))
+        for word in [word for word in word_counts if word.lower() in _STOP_WORDS]:
+            del word_counts[word]
         
         # Return top 20 most frequent keywords
         return [word for word, count in word_counts.most_common(20)]
@@ -437,88 +670,54 @@ class ResumeParser:
     def _calculate_experience_years(self, text: str) -> Optional[int]:
         """Calculate years of experience from resume text."""
         # Look for experience patterns
-        experience_patterns = [
-            r'(\d+)[\+\s]*years?\s+of\s+experience',
-            r'(\d+)[\+\s]*years?\s+experience',
-            r'over\s+(\d+)\s+years?',
-            r'more\s+than\s+(\d+)\s+years?'
-        ]
-        
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                try:
-                    return int(matches[0])
-                except ValueError:
-                    continue
+        for pattern in _EXPERIENCE_YEARS_RES:
+            match = pattern.search(text)
+            if match:
+                return int(match.group(1))
         
         # Try to calculate from dates in experience section
-        years = re.findall(r'\b(19|20)\d{2}\b', text)
+        years = [int(year) for year in _YEAR_RE.findall(text)]
         if len(years) >= 2:
-            try:
-                min_year = min(int(year) for year in years)
-                max_year = max(int(year) for year in years)
-                return max_year - min_year
-            except ValueError:
-                pass
+            return max(years) - min(years)
         
         return None
     
     def _looks_like_job_title(self, line: str) -> bool:
         """Heuristic to detect if a line looks like a job title."""
-        line = line.strip()
-        
-        # Check for common job title patterns
-        job_indicators = [
-            'manager', 'director', 'engineer', 'developer', 'analyst',
-            'specialist', 'coordinator', 'assistant', 'lead', 'senior',
-            'junior', 'intern', 'consultant', 'architect', 'designer'
-        ]
-        
+        # Section lines arrive already stripped
         line_lower = line.lower()
-        for indicator in job_indicators:
-            if indicator in line_lower:
-                return True
+        if any(indicator in line_lower for indicator in _JOB_TITLE_INDICATORS):
+            return True
         
-        # Check if it's all caps (common for job titles)
-        if line.isupper() and len(line.split()) <= 4:
+        # Check if it's all caps (common for job titles); maxsplit bounds the word count
+        # check so long lines are not split in full
+        if line.isupper() and len(line.split(None, 4)) <= 4:
             return True
         
         return False
     
     def _looks_like_degree(self, line: str) -> bool:
         """Heuristic to detect if a line looks like a degree."""
-        degree_indicators = [
-            'bachelor', 'master', 'phd', 'doctorate', 'associate',
-            'certificate', 'diploma', 'b.s.', 'b.a.', 'm.s.', 'm.a.',
-            'mba', 'university', 'college', 'institute'
-        ]
-        
         line_lower = line.lower()
-        for indicator in degree_indicators:
-            if indicator in line_lower:
-                return True
-        
-        return False
+        return any(indicator in line_lower for indicator in _DEGREE_INDICATORS)
     
     def _looks_like_project_title(self, line: str) -> bool:
         """Heuristic to detect if a line looks like a project title."""
         # Simple heuristic - projects often start with capital letters
         # and don't contain common sentence indicators
-        line = line.strip()
-        
         if not line:
             return False
         
-        # Check if it starts with capital and is not too long
+        # Check if it starts with capital and is not too long (word count checked last,
+        # splitting at most far enough to tell)
         if (line[0].isupper() and 
-            len(line.split()) <= 6 and 
             not line.endswith('.') and
-            not line.startswith('•')):
+            not line.startswith('•') and
+            len(line.split(None, 6)) <= 6):
             return True
         
         return False
 
 
 # Export the parser
-__all__ = ["ResumeParser"]
\ No newline at end of file
+__all__ = ["ResumeParser", "shutdown_pdf_executor"]
\ No newline at end of file
@@ -2,21 +2,36 @@
 Celery background tasks for resume analysis, optimization, and export.
 """
 
+import json
 import logging
+import re
+import tempfile
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 import uuid
 import asyncio
+from pathlib import Path
 
+import aiofiles.os
 from celery import Celery
-from sqlalchemy import select, update
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from celery.schedules import crontab
+from celery.signals import worker_process_init, worker_process_shutdown
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncEngine, AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
+# Imported only to register the mappers that resume relationships refer to
+import app.models.template  # noqa: F401
+import app.models.user  # noqa: F401
 from app.models.resume import Resume, ResumeAnalysis, ResumeExport, ProcessingStatus
 from app.models.job_description import JobDescription
 from app.services.ai_service import AIService
-from app.services.export_service import ExportService
+from app.services.email_service import EmailService
+from app.utils.ai_cache import close_cache, get_or_compute, make_cache_key
+from app.utils.file_parser import shutdown_pdf_executor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -30,33 +45,180 @@ celery_app = Celery(
     include=["app.workers.tasks"]
 )
 
+# Periodic tasks, built once at import rather than on every app configure
+BEAT_SCHEDULE = {
+    # Clean up expired exports daily at 2 AM
+    "cleanup_expired_exports_daily": {
+        "task": "cleanup_expired_exports",
+        "schedule": crontab(hour=2, minute=0),
+    },
+}
+
+# Long-running AI tasks, short notification tasks and periodic maintenance get
+# their own queues so quick tasks are never stuck behind a prefetched
+# analysis. Workers consume their queues in the order given to -Q, and with
+# the Redis transport priority 0 is the highest. Run a worker per queue to
+# tune prefetching separately, e.g.:
+#   celery -A app.workers.celery_app worker -Q analysis -Ofair --prefetch-multiplier=1
+#   celery -A app.workers.celery_app worker -Q notifications -Ofair --prefetch-multiplier=4 --concurrency=16
+TASK_ROUTES = {
+    "analyze_resume_task": {"queue": "analysis", "priority": 6},
+    "optimize_resume_task": {"queue": "analysis", "priority": 6},
+    "bulk_resume_analysis": {"queue": "analysis", "priority": 8},
+    "analyze_job_description_task": {"queue": "analysis", "priority": 6},
+    "send_analysis_notification": {"queue": "notifications", "priority": 0},
+    "cleanup_expired_exports": {"queue": "maintenance", "priority": 9},
+}
+
 # Celery configuration
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
-    timezone="UTC",
+    task_serializer=settings.CELERY_TASK_SERIALIZER,
+    accept_content=tuple(settings.CELERY_ACCEPT_CONTENT),
+    result_serializer=settings.CELERY_RESULT_SERIALIZER,
+    timezone=settings.CELERY_TIMEZONE,
     enable_utc=True,
-    task_track_started=True,
+    task_track_started=settings.CELERY_TASK_TRACK_STARTED,
+    # Most tasks persist their outcome to the database; tasks whose results
+    # are polled opt back in with ignore_result=False
+    task_ignore_result=True,
+    result_expires=3600,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
-    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    task_routes=TASK_ROUTES,
+    broker_transport_options={
+        "priority_steps": list(range(10)),
+        "queue_order_strategy": "priority",
+    },
+    worker_prefetch_multiplier=2,  # I/O-bound tasks, run workers with -Ofair
+    worker_lost_wait=30,
     worker_max_tasks_per_child=1000,
+    beat_schedule=BEAT_SCHEDULE,
 )
 
-# Create async database engine for tasks
-engine = create_async_engine(settings.DATABASE_URL)
+# Retry failed tasks with exponential backoff and full jitter, so retries
+# after a provider outage or rate limit don't arrive in lockstep: each retry
+# waits a random 0..min(30 * 2^n, 600) seconds
+RETRY_POLICY = {
+    "autoretry_for": (Exception,),
+    "retry_backoff": 30,
+    "retry_backoff_max": 600,
+    "retry_jitter": True,
+}
+
+# Rows per round trip when cleaning up expired exports
+_CLEANUP_BATCH_SIZE = 500
+
+# "major.minor" resume versions
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)")
+
+# Fields describing one AI call rather than its result, kept out of the cache
+_AI_PER_CALL_FIELDS = ("processing_time", "ai_provider")
+
+# JSON exports of resumes with more text than this are written compact instead of indented
+_EXPORT_JSON_INDENT_MAX_SIZE = 10 * 1024
+
+# Event loop, async database engine and services for tasks, one per worker
+# process. Created after fork so each child owns its connection pools. The
+# loop runs forever in a background thread so tasks from any execution pool
+# (prefork, threads) can submit coroutines to it.
+loop: Optional[asyncio.AbstractEventLoop] = None
+loop_thread: Optional[threading.Thread] = None
+engine: Optional[AsyncEngine] = None
+async_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+AI_SERVICE: Optional[AIService] = None
+EMAIL_SERVICE: Optional[EmailService] = None
+
+_init_lock = threading.Lock()
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """Create the worker process's persistent event loop, database engine, session factory and services."""
+    global loop, loop_thread, engine, async_session_factory, AI_SERVICE, EMAIL_SERVICE
+    
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever, name="task-event-loop", daemon=True)
+    loop_thread.start()
+    
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=1800,  # 30 minutes
+        pool_use_lifo=True,
+        query_cache_size=1200,  # Compiled statement cache, default 500
+        connect_args={
+            "server_settings": {
+                "jit": "off",  # Avoid JIT compilation stalls on short queries
+            },
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
+    )
+    # Task results read attributes after commit; don't expire them
+    async_session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    AI_SERVICE = AIService()
+    EMAIL_SERVICE = EmailService()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs):
+    """Close the AI service and cache, dispose the database engine and stop the event loop."""
+    global loop, loop_thread, engine, async_session_factory, AI_SERVICE, EMAIL_SERVICE
+    
+    shutdown_pdf_executor()
+    
+    if loop is None:
+        return
+    
+    if AI_SERVICE is not None:
+        _run_async(AI_SERVICE.aclose())
+        AI_SERVICE = None
+    EMAIL_SERVICE = None
+    
+    _run_async(close_cache())
+    
+    if engine is not None:
+        _run_async(engine.dispose())
+        engine = None
+        async_session_factory = None
+    
+    loop.call_soon_threadsafe(loop.stop)
+    loop_thread.join()
+    loop.close()
+    loop = None
+    loop_thread = None
+
+
+def _run_async(coro):
+    """Run a coroutine to completion on the worker process's event loop."""
+    # Solo/thread pools and eager mode never fire worker_process_init
+    if loop is None:
+        with _init_lock:
+            if loop is None:
+                init_worker_process()
+    
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result()
+    except BaseException:
+        # e.g. a soft time limit interrupting the wait: stop the coroutine too
+        future.cancel()
+        raise
+
 
 async def get_async_session():
     """Get async database session for tasks."""
-    async with AsyncSession(engine) as session:
+    async with async_session_factory() as session:
         try:
             yield session
         finally:
             await session.close()
 
 
-@celery_app.task(bind=True, name="analyze_resume_task")
+@celery_app.task(bind=True, name="analyze_resume_task", ignore_result=False, max_retries=3, **RETRY_POLICY)
 def analyze_resume_task(self, resume_id: str, job_description_id: Optional[str] = None):
     """
     Background task to analyze a resume.
@@ -67,18 +229,30 @@ def analyze_resume_task(self, resume_id: str, job_description_id: Optional[str]
     """
     try:
         # Run async analysis in sync context
-        result = asyncio.run(_analyze_resume_async(resume_id, job_description_id))
+        result = _run_async(_analyze_resume_async(resume_id, job_description_id))
         return result
         
+    except ValueError as e:
+        # Missing or empty records fail the same way on every attempt
+        logger.error(f"Resume analysis task failed: {resume_id}, error: {e}")
+        _run_async(_update_analysis_status(resume_id, ProcessingStatus.FAILED, str(e)))
+        return {"status": "failed", "error": str(e)}
+        
     except Exception as e:
         logger.error(f"Resume analysis task failed: {resume_id}, error: {e}")
         # Update analysis status to failed
-        asyncio.run(_update_analysis_status(resume_id, ProcessingStatus.FAILED, str(e)))
-        raise self.retry(exc=e, countdown=60, max_retries=3)
+        _run_async(_update_analysis_status(resume_id, ProcessingStatus.FAILED, str(e)))
+        raise
 
 
-@celery_app.task(bind=True, name="optimize_resume_task")
-def optimize_resume_task(self, resume_id: str, job_description_id: str, optimization_type: str = "full"):
+@celery_app.task(bind=True, name="optimize_resume_task", max_retries=3, **RETRY_POLICY)
+def optimize_resume_task(
+    self,
+    resume_id: str,
+    job_description_id: str,
+    optimization_type: str = "full",
+    use_cache: bool = True
+):
     """
     Background task to optimize a resume for a specific job.
     
@@ -86,17 +260,24 @@ def optimize_resume_task(self, resume_id: str, job_description_id: str, optimiza
         resume_id: Resume ID to optimize
         job_description_id: Target job description ID
         optimization_type: Type of optimization
+        use_cache: Reuse a cached optimization of the same content; False regenerates it
     """
     try:
-        result = asyncio.run(_optimize_resume_async(resume_id, job_description_id, optimization_type))
+        result = _run_async(
+            _optimize_resume_async(resume_id, job_description_id, optimization_type, use_cache)
+        )
         return result
         
+    except ValueError as e:
+        logger.error(f"Resume optimization task failed: {resume_id}, error: {e}")
+        return {"status": "failed", "error": str(e)}
+        
     except Exception as e:
         logger.error(f"Resume optimization task failed: {resume_id}, error: {e}")
-        raise self.retry(exc=e, countdown=60, max_retries=3)
+        raise
 
 
-@celery_app.task(bind=True, name="generate_resume_export")
+@celery_app.task(bind=True, name="generate_resume_export", ignore_result=False, max_retries=3, **RETRY_POLICY)
 def generate_resume_export(self, export_id: str):
     """
     Background task to generate resume export.
@@ -105,17 +286,22 @@ def generate_resume_export(self, export_id: str):
         export_id: Export ID to process
     """
     try:
-        result = asyncio.run(_generate_export_async(export_id))
+        result = _run_async(_generate_export_async(export_id))
         return result
         
+    except ValueError as e:
+        logger.error(f"Resume export task failed: {export_id}, error: {e}")
+        _run_async(_update_export_status(export_id, ProcessingStatus.FAILED, str(e)))
+        return {"export_id": export_id, "status": "failed", "error": str(e)}
+        
     except Exception as e:
         logger.error(f"Resume export task failed: {export_id}, error: {e}")
         # Update export status to failed
-        asyncio.run(_update_export_status(export_id, ProcessingStatus.FAILED, str(e)))
-        raise self.retry(exc=e, countdown=60, max_retries=3)
+        _run_async(_update_export_status(export_id, ProcessingStatus.FAILED, str(e)))
+        raise
 
 
-@celery_app.task(bind=True, name="bulk_resume_analysis")
+@celery_app.task(bind=True, name="bulk_resume_analysis", ignore_result=False, max_retries=2, **RETRY_POLICY)
 def bulk_resume_analysis(self, resume_ids: List[str], analysis_type: str = "general"):
     """
     Background task for bulk resume analysis.
@@ -125,28 +311,22 @@ def bulk_resume_analysis(self, resume_ids: List[str], analysis_type: str = "gene
         analysis_type: Type of analysis
     """
     try:
-        results = []
-        for resume_id in resume_ids:
-            try:
-                result = asyncio.run(_analyze_resume_async(resume_id, None, analysis_type))
-                results.append({"resume_id": resume_id, "status": "completed", "result": result})
-            except Exception as e:
-                logger.error(f"Bulk analysis failed for resume {resume_id}: {e}")
-                results.append({"resume_id": resume_id, "status": "failed", "error": str(e)})
+        results = _run_async(_bulk_analyze_resumes_async(resume_ids, analysis_type))
         
         return {
             "total_processed": len(resume_ids),
             "successful": len([r for r in results if r["status"] == "completed"]),
             "failed": len([r for r in results if r["status"] == "failed"]),
+            "skipped": len([r for r in results if r["status"] == "skipped_invalid"]),
             "results": results
         }
         
     except Exception as e:
         logger.error(f"Bulk analysis task failed: {e}")
-        raise self.retry(exc=e, countdown=60, max_retries=2)
+        raise
 
 
-@celery_app.task(bind=True, name="analyze_job_description_task")
+@celery_app.task(bind=True, name="analyze_job_description_task", max_retries=3, **RETRY_POLICY)
 def analyze_job_description_task(self, job_id: str):
     """
     Background task to analyze a job description.
@@ -155,15 +335,19 @@ def analyze_job_description_task(self, job_id: str):
         job_id: Job description ID to analyze
     """
     try:
-        result = asyncio.run(_analyze_job_description_async(job_id))
+        result = _run_async(_analyze_job_description_async(job_id))
         return result
         
+    except ValueError as e:
+        logger.error(f"Job description analysis task failed: {job_id}, error: {e}")
+        return {"job_id": job_id, "status": "failed", "error": str(e)}
+        
     except Exception as e:
         logger.error(f"Job description analysis task failed: {job_id}, error: {e}")
-        raise self.retry(exc=e, countdown=60, max_retries=3)
+        raise
 
 
-@celery_app.task(bind=True, name="extract_job_from_url_task")
+@celery_app.task(bind=True, name="extract_job_from_url_task", ignore_result=False, max_retries=2, **RETRY_POLICY)
 def extract_job_from_url_task(self, url: str, user_id: str):
     """
     Background task to extract job information from URL.
@@ -173,12 +357,12 @@ def extract_job_from_url_task(self, url: str, user_id: str):
         user_id: User ID
     """
     try:
-        result = asyncio.run(_extract_job_from_url_async(url, user_id))
+        result = _run_async(_extract_job_from_url_async(url, user_id))
         return result
         
     except Exception as e:
         logger.error(f"Job URL extraction task failed: {url}, error: {e}")
-        raise self.retry(exc=e, countdown=60, max_retries=2)
+        raise
 
 
 @celery_app.task(bind=True, name="cleanup_expired_exports")
@@ -187,7 +371,7 @@ def cleanup_expired_exports(self):
     Periodic task to clean up expired exports.
     """
     try:
-        result = asyncio.run(_cleanup_expired_exports_async())
+        result = _run_async(_cleanup_expired_exports_async())
         logger.info(f"Cleanup completed: {result}")
         return result
         
@@ -208,13 +392,8 @@ def send_analysis_notification(self, user_email: str, user_name: str, resume_tit
         analysis_score: Analysis score
     """
     try:
-        from app.services.email_service import EmailService
-        email_service = EmailService()
-        
-        result = asyncio.run(
-            email_service.send_resume_analysis_complete_email(
-                user_email, user_name, resume_title, analysis_score, 5  # mock recommendations count
-            )
+        result = _run_async(
+            _send_analysis_notification_async(user_email, user_name, resume_title, analysis_score)
         )
         return {"email_sent": result, "recipient": user_email}
         
@@ -225,53 +404,93 @@ def send_analysis_notification(self, user_email: str, user_name: str, resume_tit
 
 # Async helper functions
 
-async def _analyze_resume_async(resume_id: str, job_description_id: Optional[str] = None, analysis_type: str = "general"):
-    """Async helper for resume analysis."""
-    async with AsyncSession(engine) as session:
+# Lookup-by-id statements, built once and reused by every task
+_GET_STMTS = {
+    JobDescription: select(JobDescription).where(JobDescription.id == bindparam("id")),
+    # Exports are always processed together with their resume
+    ResumeExport: (
+        select(ResumeExport)
+        .options(joinedload(ResumeExport.resume))
+        .where(ResumeExport.id == bindparam("id"))
+    ),
+}
+
+
+def _to_uuid(value: Union[str, uuid.UUID]) -> uuid.UUID:
+    """Parse a task's string ID, passing already-parsed UUIDs through."""
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(value)
+
+
+def _is_parsed_ai_result(result: Dict[str, Any]) -> bool:
+    """Only cache AI results whose response parsed cleanly."""
+    return "parse_error" not in result
+
+
+async def _get_by_id(session: AsyncSession, model, record_id: Union[str, uuid.UUID]):
+    """Fetch a record by its ID using the prebuilt lookup statement."""
+    result = await session.execute(_GET_STMTS[model], {"id": _to_uuid(record_id)})
+    return result.scalar_one_or_none()
+
+
+async def _analyze_resume_async(
+    resume_id: Union[str, uuid.UUID],
+    job_description_id: Optional[str] = None,
+    analysis_type: str = "general",
+    resume_text: Optional[str] = None
+):
+    """Async helper for resume analysis, optionally with the resume text already fetched."""
+    rid = _to_uuid(resume_id)
+    jid = _to_uuid(job_description_id) if job_description_id else None
+    async with async_session_factory() as session:
         try:
-            # Get resume
-            resume_result = await session.execute(
-                select(Resume).where(Resume.id == uuid.UUID(resume_id))
-            )
-            resume = resume_result.scalar_one_or_none()
-            
-            if not resume:
-                raise ValueError(f"Resume not found: {resume_id}")
+            # Get resume text unless the caller already fetched it
+            if resume_text is None:
+                resume_result = await session.execute(
+                    select(Resume.raw_text).where(Resume.id == rid)
+                )
+                resume_row = resume_result.first()
+                
+                if not resume_row:
+                    raise ValueError(f"Resume not found: {resume_id}")
+                
+                resume_text = resume_row.raw_text
             
-            if not resume.raw_text:
+            if not resume_text:
                 raise ValueError("Resume has no content to analyze")
             
             # Get job description if provided
             job_text = None
-            if job_description_id:
-                job_result = await session.execute(
-                    select(JobDescription).where(JobDescription.id == uuid.UUID(job_description_id))
-                )
-                job_description = job_result.scalar_one_or_none()
+            if jid:
+                job_description = await _get_by_id(session, JobDescription, jid)
                 if job_description:
                     job_text = job_description.description
             
             # Create or get analysis record
             analysis_result = await session.execute(
                 select(ResumeAnalysis).where(
-                    ResumeAnalysis.resume_id == uuid.UUID(resume_id)
+                    ResumeAnalysis.resume_id == rid
                 ).order_by(ResumeAnalysis.created_at.desc())
             )
             analysis = analysis_result.scalar_one_or_none()
             
             if not analysis:
                 analysis = ResumeAnalysis(
-                    resume_id=uuid.UUID(resume_id),
-                    job_description_id=uuid.UUID(job_description_id) if job_description_id else None,
+                    resume_id=rid,
+                    job_description_id=jid,
                     analysis_type=analysis_type,
                     status=ProcessingStatus.IN_PROGRESS
                 )
                 session.add(analysis)
                 await session.flush()
             
-            # Perform AI analysis
-            ai_service = AIService()
-            ai_result = await ai_service.analyze_resume(resume.raw_text, job_text, analysis_type)
+            # Perform AI analysis, reusing the result for identical content
+            ai_result = await get_or_compute(
+                make_cache_key("resume:analysis", resume_text, job_text or "", analysis_type),
+                lambda: AI_SERVICE.analyze_resume(resume_text, job_text, analysis_type),
+                settings.RESUME_ANALYSIS_CACHE_TTL,
+                should_cache=_is_parsed_ai_result,
+                per_call_fields=_AI_PER_CALL_FIELDS
+            )
             
             # Update analysis with results
             analysis.overall_score = ai_result.get("overall_score")
@@ -285,16 +504,20 @@ async def _analyze_resume_async(resume_id: str, job_description_id: Optional[str
             analysis.missing_keywords = ai_result.get("missing_keywords", [])
             analysis.extracted_skills = ai_result.get("extracted_skills", [])
             analysis.analysis_data = ai_result
+            # Cache hits carry no per-call fields: no model ran for this analysis
             analysis.processing_time = ai_result.get("processing_time")
-            analysis.ai_model_used = ai_result.get("ai_provider", "unknown")
+            analysis.ai_model_used = ai_result.get("ai_provider", "cache")
             analysis.status = ProcessingStatus.COMPLETED
             
             # Update resume scores
+            resume_values = {"last_analyzed_at": datetime.utcnow()}
             if analysis.overall_score:
-                resume.analysis_score = analysis.overall_score
+                resume_values["analysis_score"] = analysis.overall_score
             if analysis.ats_score:
-                resume.ats_score = analysis.ats_score
-            resume.last_analyzed_at = datetime.utcnow()
+                resume_values["ats_score"] = analysis.ats_score
+            await session.execute(
+                update(Resume).where(Resume.id == rid).values(**resume_values)
+            )
             
             await session.commit()
             
@@ -311,30 +534,86 @@ async def _analyze_resume_async(resume_id: str, job_description_id: Optional[str
             raise
 
 
-async def _optimize_resume_async(resume_id: str, job_description_id: str, optimization_type: str):
-    """Async helper for resume optimization."""
-    async with AsyncSession(engine) as session:
+async def _bulk_analyze_resumes_async(resume_ids: List[str], analysis_type: str) -> List[Dict[str, Any]]:
+    """Async helper for bulk analysis, running a bounded number of analyses concurrently."""
+    parsed_ids = {}
+    for resume_id in resume_ids:
         try:
-            # Get resume and job description
-            resume_result = await session.execute(
-                select(Resume).where(Resume.id == uuid.UUID(resume_id))
+            parsed_ids[resume_id] = uuid.UUID(resume_id)
+        except ValueError:
+            pass
+    
+    # Fetch every analyzable resume's text in one query instead of one per
+    # analysis; IDs that are malformed, unknown or have no text are skipped
+    async with async_session_factory() as session:
+        resume_rows = await session.execute(
+            select(Resume.id, Resume.raw_text).where(
+                Resume.id.in_(set(parsed_ids.values())),
+                Resume.raw_text.isnot(None)
             )
-            resume = resume_result.scalar_one_or_none()
-            
-            job_result = await session.execute(
-                select(JobDescription).where(JobDescription.id == uuid.UUID(job_description_id))
+        )
+        resume_texts = {row.id: row.raw_text for row in resume_rows}
+    
+    semaphore = asyncio.Semaphore(settings.BULK_ANALYSIS_CONCURRENCY)
+    
+    async def analyze(resume_id: str) -> Dict[str, Any]:
+        rid = parsed_ids.get(resume_id)
+        if rid not in resume_texts:
+            return {"resume_id": resume_id, "status": "skipped_invalid"}
+        
+        async with semaphore:
+            try:
+                result = await _analyze_resume_async(
+                    rid, None, analysis_type, resume_text=resume_texts[rid]
+                )
+                return {"resume_id": resume_id, "status": "completed", "result": result}
+            except Exception as e:
+                logger.error(f"Bulk analysis failed for resume {resume_id}: {e}")
+                return {"resume_id": resume_id, "status": "failed", "error": str(e)}
+    
+    return await asyncio.gather(*(analyze(resume_id) for resume_id in resume_ids))
+
+
+async def _optimize_resume_async(
+    resume_id: str,
+    job_description_id: str,
+    optimization_type: str,
+    use_cache: bool = True
+):
+    """Async helper for resume optimization."""
+    async with async_session_factory() as session:
+        try:
+            # Get resume and job description in a single round trip
+            result = await session.execute(
+                select(Resume, JobDescription).where(
+                    Resume.id == uuid.UUID(resume_id),
+                    JobDescription.id == uuid.UUID(job_description_id)
+                )
             )
-            job_description = job_result.scalar_one_or_none()
+            row = result.first()
             
-            if not resume or not job_description:
+            if not row:
                 raise ValueError("Resume or job description not found")
             
-            # Perform AI optimization
-            ai_service = AIService()
-            optimization_result = await ai_service.optimize_resume(
-                resume.raw_text,
-                job_description.description,
-                optimization_type
+            resume, job_description = row
+            
+            # Perform AI optimization, reusing the result for identical content
+            optimization_result = await get_or_compute(
+                make_cache_key(
+                    "resume:optimization",
+                    resume.raw_text or "",
+                    job_description.description or "",
+                    optimization_type
+                ),
+                lambda: AI_SERVICE.optimize_resume(
+                    resume.raw_text,
+                    job_description.description,
+                    optimization_type
+                ),
+                settings.RESUME_OPTIMIZATION_CACHE_TTL,
+                refresh=not use_cache,
+                should_cache=_is_parsed_ai_result,
+                per_call_fields=_AI_PER_CALL_FIELDS
             )
             
             # Create optimized resume version
@@ -347,8 +626,9 @@ async def _optimize_resume_async(resume_id: str, job_description_id: str, optimi
                 parent_resume_id=resume.id,
                 version=_get_next_version(resume.version),
                 raw_text=optimization_result.get("optimized_content", resume.raw_text),
-                structured_data=resume.structured_data.copy() if resume.structured_data else {},
-                word_count=len(optimization_result.get("optimized_content", "").split()),
+                # Plain JSONB (not mutation-tracked), so the new row can share the dict
+                structured_data=resume.structured_data or {},
+                word_count=optimization_result.get("word_count", 0),
                 page_count=resume.page_count
             )
             
@@ -370,13 +650,10 @@ async def _optimize_resume_async(resume_id: str, job_description_id: str, optimi
 
 async def _generate_export_async(export_id: str):
     """Async helper for export generation."""
-    async with AsyncSession(engine) as session:
+    async with async_session_factory() as session:
         try:
-            # Get export record
-            export_result = await session.execute(
-                select(ResumeExport).where(ResumeExport.id == uuid.UUID(export_id))
-            )
-            export_record = export_result.scalar_one_or_none()
+            # Get export record together with its resume
+            export_record = await _get_by_id(session, ResumeExport, export_id)
             
             if not export_record:
                 raise ValueError(f"Export record not found: {export_id}")
@@ -384,17 +661,11 @@ async def _generate_export_async(export_id: str):
             export_record.status = ProcessingStatus.IN_PROGRESS
             export_record.started_at = datetime.utcnow()
             
-            # Get resume
-            resume_result = await session.execute(
-                select(Resume).where(Resume.id == export_record.resume_id)
-            )
-            resume = resume_result.scalar_one_or_none()
-            
+            resume = export_record.resume
             if not resume:
                 raise ValueError("Resume not found for export")
             
             # Generate export file (simplified implementation)
-            export_service = ExportService()
             file_path = await _generate_export_file(
                 resume, 
                 export_record.export_format,
@@ -427,20 +698,16 @@ async def _generate_export_async(export_id: str):
 
 async def _analyze_job_description_async(job_id: str):
     """Async helper for job description analysis."""
-    async with AsyncSession(engine) as session:
+    async with async_session_factory() as session:
         try:
             # Get job description
-            job_result = await session.execute(
-                select(JobDescription).where(JobDescription.id == uuid.UUID(job_id))
-            )
-            job_description = job_result.scalar_one_or_none()
+            job_description = await _get_by_id(session, JobDescription, job_id)
             
             if not job_description:
                 raise ValueError(f"Job description not found: {job_id}")
             
             # Perform AI analysis
-            ai_service = AIService()
-            analysis_result = await ai_service.extract_job_requirements(job_description.description)
+            analysis_result = await AI_SERVICE.extract_job_requirements(job_description.description)
             
             # Update job description with analysis results
             if analysis_result.get("required_skills"):
@@ -489,36 +756,35 @@ async def _extract_job_from_url_async(url: str, user_id: str):
 
 async def _cleanup_expired_exports_async():
     """Async helper for cleaning up expired exports."""
-    async with AsyncSession(engine) as session:
+    async with async_session_factory() as session:
         try:
-            from pathlib import Path
-            
-            # Get expired exports
             cutoff_date = datetime.utcnow()
             
-            expired_exports = await session.execute(
-                select(ResumeExport).where(
+            # Delete a batch of expired exports per round trip, getting their files back
+            expired_batch = (
+                select(ResumeExport.id)
+                .where(
                     ResumeExport.expires_at < cutoff_date,
                     ResumeExport.status == ProcessingStatus.COMPLETED
                 )
+                .limit(_CLEANUP_BATCH_SIZE)
+            )
+            delete_batch = (
+                delete(ResumeExport)
+                .where(ResumeExport.id.in_(expired_batch))
+                .returning(ResumeExport.file_path)
             )
             
             cleaned_count = 0
-            for export in expired_exports.scalars():
-                # Delete file if exists
-                if export.file_path:
-                    try:
-                        file_path = Path(export.file_path)
-                        if file_path.exists():
-                            file_path.unlink()
-                    except Exception as e:
-                        logger.warning(f"Failed to delete expired export file: {export.file_path}, error: {e}")
+            while True:
+                file_paths = (await session.execute(delete_batch)).scalars().all()
+                if not file_paths:
+                    break
                 
-                # Delete export record
-                await session.delete(export)
-                cleaned_count += 1
-            
-            await session.commit()
+                await session.commit()
+                cleaned_count += len(file_paths)
+                
+                await _delete_files([file_path for file_path in file_paths if file_path])
             
             return {"cleaned_exports": cleaned_count}
             
@@ -528,22 +794,42 @@ async def _cleanup_expired_exports_async():
             raise
 
 
+async def _send_analysis_notification_async(
+    user_email: str,
+    user_name: str,
+    resume_title: str,
+    analysis_score: float
+) -> bool:
+    """Async helper for sending the analysis completion email."""
+    return await EMAIL_SERVICE.send_resume_analysis_complete_email(
+        user_email, user_name, resume_title, analysis_score, 5  # mock recommendations count
+    )
+
+
 async def _update_analysis_status(resume_id: str, status: ProcessingStatus, error_message: Optional[str] = None):
-    """Update analysis status."""
-    async with AsyncSession(engine) as session:
+    """Update the status of a resume's latest analysis."""
+    values = {"status": status}
+    if error_message:
+        values["error_message"] = error_message
+    
+    async with async_session_factory() as session:
         try:
-            analysis_result = await session.execute(
-                select(ResumeAnalysis).where(
-                    ResumeAnalysis.resume_id == uuid.UUID(resume_id)
-                ).order_by(ResumeAnalysis.created_at.desc())
+            # Built inside the try: a malformed ID must be logged, not raised
+            latest_analysis_id = (
+                select(ResumeAnalysis.id)
+                .where(ResumeAnalysis.resume_id == _to_uuid(resume_id))
+                .order_by(ResumeAnalysis.created_at.desc())
+                .limit(1)
+                .scalar_subquery()
             )
-            analysis = analysis_result.scalar_one_or_none()
             
-            if analysis:
-                analysis.status = status
-                if error_message:
-                    analysis.error_message = error_message
-                await session.commit()
+            async with session.begin():
+                await session.execute(
+                    update(ResumeAnalysis)
+                    .where(ResumeAnalysis.id == latest_analysis_id)
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
                 
         except Exception as e:
             logger.error(f"Failed to update analysis status: {e}")
@@ -551,18 +837,19 @@ async def _update_analysis_status(resume_id: str, status: ProcessingStatus, erro
 
 async def _update_export_status(export_id: str, status: ProcessingStatus, error_message: Optional[str] = None):
     """Update export status."""
-    async with AsyncSession(engine) as session:
+    values = {"status": status}
+    if error_message:
+        values["error_message"] = error_message
+    
+    async with async_session_factory() as session:
         try:
-            export_result = await session.execute(
-                select(ResumeExport).where(ResumeExport.id == uuid.UUID(export_id))
-            )
-            export_record = export_result.scalar_one_or_none()
-            
-            if export_record:
-                export_record.status = status
-                if error_message:
-                    export_record.error_message = error_message
-                await session.commit()
+            async with session.begin():
+                await session.execute(
+                    update(ResumeExport)
+                    .where(ResumeExport.id == uuid.UUID(export_id))
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
                 
         except Exception as e:
             logger.error(f"Failed to update export status: {e}")
@@ -572,53 +859,73 @@ async def _update_export_status(export_id: str, status: ProcessingStatus, error_
 
 async def _generate_export_file(resume: Resume, export_format: str, export_settings: Dict[str, Any]):
     """Generate export file (simplified implementation)."""
-    from pathlib import Path
-    import tempfile
+    # Render and write in a worker thread so large exports don't block the
+    # event loop; the thread only sees plain values, never the ORM object
+    return await asyncio.to_thread(
+        _render_export_file,
+        resume.title,
+        resume.raw_text,
+        resume.structured_data,
+        resume.created_at,
+        export_format
+    )
+
+
+def _render_export_file(
+    title: str,
+    raw_text: Optional[str],
+    structured_data: Optional[Dict[str, Any]],
+    created_at: datetime,
+    export_format: str
+) -> Path:
+    """Render export content and write it to a new temporary file."""
+    if export_format == "txt":
+        content = raw_text or ""
+    elif export_format == "json":
+        export_data = {
+            "title": title,
+            "content": raw_text,
+            "structured_data": structured_data,
+            "created_at": created_at.isoformat()
+        }
+        # Indentation roughly doubles large exports, so only pretty-print small
+        # ones; the resume text dominates the size, so decide before encoding
+        if len(raw_text or "") <= _EXPORT_JSON_INDENT_MAX_SIZE:
+            content = json.dumps(export_data, indent=2)
+        else:
+            content = json.dumps(export_data, separators=(",", ":"))
+    else:
+        # For PDF/DOCX, would use proper libraries
+        content = f"Export format {export_format} - {title}\n\n{raw_text or ''}"
     
-    # Create temporary file
     with tempfile.NamedTemporaryFile(
         mode='w', 
         suffix=f'.{export_format}', 
         delete=False
     ) as temp_file:
-        if export_format == "txt":
-            temp_file.write(resume.raw_text or "")
-        elif export_format == "json":
-            import json
-            export_data = {
-                "title": resume.title,
-                "content": resume.raw_text,
-                "structured_data": resume.structured_data,
-                "created_at": resume.created_at.isoformat()
-            }
-            json.dump(export_data, temp_file, indent=2)
-        else:
-            # For PDF/DOCX, would use proper libraries
-            temp_file.write(f"Export format {export_format} - {resume.title}\n\n{resume.raw_text or ''}")
+        temp_file.write(content)
         
         return Path(temp_file.name)
 
 
+async def _delete_files(file_paths: List[str]) -> None:
+    """Delete export files concurrently, logging failures instead of raising."""
+    results = await asyncio.gather(
+        *(aiofiles.os.remove(file_path) for file_path in file_paths),
+        return_exceptions=True
+    )
+    for file_path, result in zip(file_paths, results):
+        if isinstance(result, Exception) and not isinstance(result, FileNotFoundError):
+            logger.warning(f"Failed to delete expired export file: {file_path}, error: {result}")
+
+
 def _get_next_version(current_version: str) -> str:
     """Generate next version number."""
-    try:
-        major, minor = current_version.split(".")
-        return f"{major}.{int(minor) + 1}"
-    except:
+    match = _VERSION_RE.fullmatch(current_version or "")
+    if not match:
         return "1.1"
-
-
-# Periodic tasks setup
-@celery_app.on_after_configure.connect
-def setup_periodic_tasks(sender, **kwargs):
-    """Setup periodic tasks."""
     
-    # Clean up expired exports daily at 2 AM
-    sender.add_periodic_task(
-        24 * 60 * 60,  # 24 hours
-        cleanup_expired_exports.s(),
-        name="cleanup_expired_exports_daily"
-    )
+    return f"{match[1]}.{int(match[2]) + 1}"
 
 
 # Export tasks
@@ -48,7 +48,8 @@ def run_worker():
     
     cmd = [
         "celery", "-A", "app.workers.celery_app",
-        "worker", "--loglevel=info"
+        "worker", "--loglevel=info",
+        "-Q", "notifications,celery,analysis,maintenance", "-Ofair"
     ]
     
     try:
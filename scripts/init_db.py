@@ -9,14 +9,18 @@ import logging
 import os
 import sys
 from pathlib import Path
+from typing import NamedTuple, Optional
 
 # Add the app directory to the Python path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+from sqlalchemy import inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app import database
 from app.config import settings
-from app.database import init_db, get_session_context, Base, engine
+from app.database import init_db, get_session_context, Base
 from app.models.user import User, UserRole, UserStatus, SubscriptionType
 from app.core.security import hash_password
 
@@ -24,148 +28,149 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _has_missing_tables(sync_conn) -> bool:
+    """Check for missing tables with one catalog query instead of one per table."""
+    existing_tables = set(inspect(sync_conn).get_table_names())
+    return any(table.name not in existing_tables for table in Base.metadata.sorted_tables)
+
+
 async def create_tables():
-    """Create all database tables."""
+    """Create all database tables on the already initialized engine."""
     try:
-        if not engine:
-            await init_db()
-        
-        async with engine.begin() as conn:
+        # Read the engine from the module: init_db() rebinds it after import
+        async with database.engine.begin() as conn:
+            # Re-runs skip create_all and its per-table existence checks
+            if not await conn.run_sync(_has_missing_tables):
+                logger.info("Database tables already exist")
+                return
+            
             await conn.run_sync(Base.metadata.create_all)
         
         logger.info("Database tables created successfully")
         
     except Exception as e:
-        logger.error(f"Failed to create tables: {e}")
+        logger.error("Failed to create tables: %s", e)
         raise
 
 
-async def create_admin_user():
-    """Create default admin user if it doesn't exist."""
+class SeedUser(NamedTuple):
+    """A user created by the seed."""
+    email: str
+    username: str
+    password: str
+    first_name: str
+    last_name: str
+    job_title: Optional[str] = None
+    company: Optional[str] = None
+    industry: Optional[str] = None
+    experience_years: Optional[int] = None
+    role: UserRole = UserRole.USER
+    subscription_type: SubscriptionType = SubscriptionType.FREE
+
+
+# Default admin account, always seeded
+ADMIN_USER = SeedUser(
+    "admin@airesume.com", "admin", "Admin123!", "Admin", "User",
+    role=UserRole.ADMIN,
+    subscription_type=SubscriptionType.ENTERPRISE
+)
+
+# Sample users, seeded in development only. Their passwords use the minimum
+# bcrypt cost: fine for throwaway development accounts, never for real ones
+SAMPLE_USER_BCRYPT_ROUNDS = 4
+SAMPLE_USERS = (
+    SeedUser(
+        "user1@example.com", "user1", "User123!", "John", "Doe",
+        "Software Engineer", "Tech Corp", "technology", 5
+    ),
+    SeedUser(
+        "user2@example.com", "user2", "User123!", "Jane", "Smith",
+        "Product Manager", "StartupXYZ", "technology", 3
+    ),
+    SeedUser(
+        "premium@example.com", "premium_user", "Premium123!", "Premium", "User",
+        "Senior Developer", "Big Tech", "technology", 8,
+        subscription_type=SubscriptionType.PREMIUM
+    ),
+)
+
+
+async def seed_users(include_sample_data: bool = False):
+    """
+    Create the admin user and, optionally, sample users in one transaction.
+    
+    Existing users are left untouched: the insert skips emails that are
+    already taken, so no lookups are needed beforehand.
+    """
     try:
-        async with get_session_context() as session:
-            # Check if admin user already exists
-            from sqlalchemy import select
-            result = await session.execute(
-                select(User).where(User.email == "admin@airesume.com")
+        sample_users = SAMPLE_USERS if include_sample_data else ()
+        users = (ADMIN_USER, *sample_users)
+        
+        # bcrypt is deliberately slow; hash in threads, concurrently
+        hashed_passwords = await asyncio.gather(
+            asyncio.to_thread(hash_password, ADMIN_USER.password),
+            *(
+                asyncio.to_thread(hash_password, user.password, SAMPLE_USER_BCRYPT_ROUNDS)
+                for user in sample_users
             )
-            admin_user = result.scalar_one_or_none()
-            
-            if not admin_user:
-                # Create admin user
-                admin_user = User(
-                    email="admin@airesume.com",
-                    username="admin",
-                    hashed_password=hash_password("Admin123!"),
-                    first_name="Admin",
-                    last_name="User",
-                    role=UserRole.ADMIN,
-                    status=UserStatus.ACTIVE,
-                    subscription_type=SubscriptionType.ENTERPRISE,
-                    is_active=True,
-                    is_verified=True
-                )
-                
-                session.add(admin_user)
-                await session.commit()
-                
-                logger.info("Admin user created successfully")
-                logger.info("Email: admin@airesume.com")
-                logger.info("Password: Admin123!")
-            else:
-                logger.info("Admin user already exists")
+        )
+        
+        # Every row carries the same columns, so the upsert goes out as a
+        # single multi-row batch
+        rows = [
+            {
+                "email": user.email,
+                "username": user.username,
+                "hashed_password": hashed_password,
+                "first_name": user.first_name,
+                "last_name": user.last_name,
+                "job_title": user.job_title,
+                "company": user.company,
+                "industry": user.industry,
+                "experience_years": user.experience_years,
+                "role": user.role,
+                "subscription_type": user.subscription_type,
+                "status": UserStatus.ACTIVE,
+                "is_active": True,
+                "is_verified": True
+            }
+            for user, hashed_password in zip(users, hashed_passwords)
+        ]
         
-    except Exception as e:
-        logger.error(f"Failed to create admin user: {e}")
-        raise
-
-
-async def seed_sample_data():
-    """Seed database with sample data for development."""
-    try:
         async with get_session_context() as session:
-            # Create sample users
-            sample_users = [
-                {
-                    "email": "user1@example.com",
-                    "username": "user1",
-                    "password": "User123!",
-                    "first_name": "John",
-                    "last_name": "Doe",
-                    "job_title": "Software Engineer",
-                    "company": "Tech Corp",
-                    "industry": "technology",
-                    "experience_years": 5
-                },
-                {
-                    "email": "user2@example.com",
-                    "username": "user2",
-                    "password": "User123!",
-                    "first_name": "Jane",
-                    "last_name": "Smith",
-                    "job_title": "Product Manager",
-                    "company": "StartupXYZ",
-                    "industry": "technology",
-                    "experience_years": 3
-                },
-                {
-                    "email": "premium@example.com",
-                    "username": "premium_user",
-                    "password": "Premium123!",
-                    "first_name": "Premium",
-                    "last_name": "User",
-                    "job_title": "Senior Developer",
-                    "company": "Big Tech",
-                    "industry": "technology",
-                    "experience_years": 8,
-                    "subscription_type": SubscriptionType.PREMIUM
-                }
-            ]
-            
-            from sqlalchemy import select
-            
-            for user_data in sample_users:
-                # Check if user already exists
-                result = await session.execute(
-                    select(User).where(User.email == user_data["email"])
-                )
-                existing_user = result.scalar_one_or_none()
-                
-                if not existing_user:
-                    subscription_type = user_data.pop("subscription_type", SubscriptionType.FREE)
-                    password = user_data.pop("password")
-                    
-                    user = User(
-                        **user_data,
-                        hashed_password=hash_password(password),
-                        role=UserRole.USER,
-                        status=UserStatus.ACTIVE,
-                        subscription_type=subscription_type,
-                        is_active=True,
-                        is_verified=True
-                    )
-                    
-                    session.add(user)
+            result = await session.execute(
+                pg_insert(User)
+                .on_conflict_do_nothing(index_elements=["email"])
+                .returning(User.email),
+                rows
+            )
+            created_emails = set(result.scalars())
             
             await session.commit()
+        
+        if ADMIN_USER.email in created_emails:
+            logger.info("Admin user created successfully")
+            logger.info("Email: %s", ADMIN_USER.email)
+            logger.info("Password: %s", ADMIN_USER.password)
+        else:
+            logger.info("Admin user already exists")
+        
+        if include_sample_data:
             logger.info("Sample data seeded successfully")
         
+        logger.info("Seeded %d new users", len(created_emails))
+        
     except Exception as e:
-        logger.error(f"Failed to seed sample data: {e}")
+        logger.error("Failed to seed users: %s", e)
         raise
 
 
 async def run_migrations():
     """Run database migrations using Alembic."""
-    try:
-        # This would typically be done via Alembic command line
-        # For now, we'll just ensure tables are created
-        await create_tables()
-        logger.info("Migrations completed successfully")
-        
-    except Exception as e:
-        logger.error(f"Failed to run migrations: {e}")
-        raise
+    # This would typically be done via Alembic command line
+    # For now, we'll just ensure tables are created
+    await create_tables()
+    logger.info("Migrations completed successfully")
 
 
 async def main():
@@ -180,17 +185,13 @@ async def main():
         # Run migrations
         await run_migrations()
         
-        # Create admin user
-        await create_admin_user()
-        
-        # Seed sample data only in development
-        if settings.DEBUG:
-            await seed_sample_data()
+        # Create admin user, plus sample data only in development
+        await seed_users(include_sample_data=settings.DEBUG)
         
         logger.info("Database initialization completed successfully!")
         
     except Exception as e:
-        logger.error(f"Database initialization failed: {e}")
+        logger.error("Database initialization failed: %s", e)
         sys.exit(1)
 
 